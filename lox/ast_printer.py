@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-import shutil
-from dataclasses import dataclass
+import hashlib
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import translate
+from itertools import count
 from pathlib import Path
-from typing import Any, List, Optional
-from typing import Set as PySet
-from typing import TypeVar
-
-from pygraphviz import AGraph
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .expr import (
     Assign,
@@ -42,24 +55,223 @@ from .tokens import Token
 
 T = TypeVar("T")
 
+# Files written by AstPrinter that prune_stale_images may remove.
+_OUTPUT_PATTERNS = (
+    "ast_statement_*.png",
+    "ast_statement_*.hash",
+    "all.pdf",
+    "all.hash",
+)
+_OUTPUT_RE = re.compile("|".join(translate(pattern) for pattern in _OUTPUT_PATTERNS))
+
+# Kinds of PrintNode that are rendered as bare text rather than parenthesized.
+_LEAF_KINDS = frozenset(
+    ("name", "this", "variable", "nil", "string", "number", "value")
+)
 
-@dataclass
-class GraphNode:
+# DOT node IDs ("node0", "node1", ...) already formatted, indexed by number.
+_NODE_IDS: List[str] = []
+
+
+@dataclass(slots=True)
+class PrintNode:
     """
-    Represents a node in the Abstract Syntax Tree visualization graph.
+    Typed intermediate representation of an AST node, shared by the text and
+    graph renderers.
 
     Attributes:
-        id (str): Unique identifier for the node.
-        label (str): Display label for the node.
-        parent (Optional[str]): ID of the parent node, if any.
+        kind (str): The kind of node, e.g. "binary", "print" or "number".
+        label (str): The node's name, operator or raw value. Names and
+            operators are interned, so repeated labels share one string.
+        children (List[PrintNode]): The child nodes in print order.
     """
 
-    id: str
+    kind: str
     label: str
-    parent: Optional[str] = None
+    children: List[PrintNode] = field(default_factory=list)
+
+    @property
+    def is_leaf(self) -> bool:
+        """
+        Check whether the node is rendered as bare text.
+
+        Returns:
+            bool: True for names and literal values, False for parenthesized nodes.
+        """
+        return self.kind in _LEAF_KINDS
+
+
+def _digest(text: str) -> str:
+    """
+    Hash a graph description for detecting unchanged output.
+
+    Args:
+        text (str): The DOT text of the graph.
+
+    Returns:
+        str: Hex digest of the text.
+    """
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def render_text(node: PrintNode) -> str:
+    """
+    Render a PrintNode tree as a parenthesized string.
+
+    The tree is walked with an explicit work stack of nodes and pending
+    separator tokens, so deeply nested trees do not hit the recursion limit.
+
+    Args:
+        node (PrintNode): The root node to render.
+
+    Returns:
+        str: The parenthesized string representation.
+    """
+    out: List[str] = []
+    stack: List[Union[PrintNode, str]] = [node]
+
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            out.append(item)
+        elif item.is_leaf:
+            out.append(f'"{item.label}"' if item.kind == "string" else item.label)
+        else:
+            out.append("(")
+            out.append(item.label)
+            stack.append(")")
+            for child in reversed(item.children):
+                stack.append(child)
+                stack.append(" ")
+
+    return "".join(out)
+
+
+def _quote(text: str) -> str:
+    """
+    Quote a string for use as a DOT attribute value.
+
+    Backslashes are escaped before double quotes, as pygraphviz does when
+    adding a node, so that a Lox string containing or ending in a backslash
+    is drawn as written instead of breaking the DOT text.
+
+    Args:
+        text (str): The string to quote.
+
+    Returns:
+        str: The double-quoted, escaped string.
+    """
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _node_id(number: int) -> str:
+    """
+    Get the DOT ID for a node number.
+
+    IDs are formatted in batches and kept for reuse, since every graph
+    numbers its nodes from the start again.
+
+    Args:
+        number (int): The node number.
+
+    Returns:
+        str: The node ID, e.g. "node3".
+    """
+    if number >= len(_NODE_IDS):
+        start = len(_NODE_IDS)
+        _NODE_IDS.extend(f"node{i}" for i in range(start, number + 1024))
+    return _NODE_IDS[number]
+
+
+def render_dot(
+    node: PrintNode,
+    out: List[str],
+    parent: Optional[str] = None,
+    ids: Optional[Iterator[int]] = None,
+) -> str:
+    """
+    Append the DOT statements of a PrintNode tree to a buffer, labelling
+    literals by their type.
+
+    Nodes are numbered in pre-order using an explicit work stack.
+
+    Args:
+        node (PrintNode): The root node to add.
+        out (List[str]): The buffer of DOT statements to append to.
+        parent (Optional[str]): ID of the node to attach the tree to, if any.
+        ids (Optional[Iterator[int]]): Source of node numbers. Defaults to
+            numbering from 1.
+
+    Returns:
+        str: The ID of the graph node created for `node`.
+    """
+    if ids is None:
+        ids = count(1)
+
+    root_id: Optional[str] = None
+    stack: List[Tuple[PrintNode, Optional[str]]] = [(node, parent)]
+
+    while stack:
+        current, parent_id = stack.pop()
+        if current.kind == "string":
+            label = f'String: "{current.label}"'
+        elif current.kind == "number":
+            label = f"Number: {current.label}"
+        else:
+            label = current.label
+
+        node_id = _node_id(next(ids))
+        out.append(f"{node_id} [label={_quote(label)}];")
+        if parent_id:
+            out.append(f"{parent_id} -> {node_id};")
+
+        if root_id is None:
+            root_id = node_id
+        stack.extend((child, node_id) for child in reversed(current.children))
+
+    assert root_id is not None
+    return root_id
+
+
+def _statement_dot(node: Optional[PrintNode]) -> str:
+    """
+    Describe the graph of a single statement in DOT.
+
+    Args:
+        node (Optional[PrintNode]): The statement's root node, if any.
+
+    Returns:
+        str: The DOT text of the graph.
+    """
+    out = ["strict digraph {"]
+    if node:
+        render_dot(node, out)
+    out.append("}")
+    return "\n".join(out)
+
+
+def _draw_dot(job: Tuple[str, str]) -> None:
+    """
+    Lay out a graph given as DOT text and draw it to a file.
+
+    The graph is handed to graphviz in one call rather than built node by
+    node. Module level so it can run in worker processes.
+
+    pygraphviz is imported here rather than at module level, so that
+    printing the AST as text does not load the graphviz bindings.
+
+    Args:
+        job (Tuple[str, str]): The DOT text and the path of the output file.
+    """
+    from pygraphviz import AGraph  # type: ignore[import-untyped]
+
+    dot, output_file = job
+    graph = AGraph(string=dot)
+    graph.layout(prog="dot")
+    graph.draw(output_file)
 
 
-class AstPrinter(ExprVisitor[str], StmtVisitor[str]):
+class AstPrinter(ExprVisitor[PrintNode], StmtVisitor[PrintNode]):
     """
     AST visualization generator implementing both expression and statement visitors.
 
@@ -67,570 +279,613 @@ class AstPrinter(ExprVisitor[str], StmtVisitor[str]):
     representations and visual graph outputs. It implements the Visitor pattern through
     both ExprVisitor and StmtVisitor interfaces to handle all types of AST nodes.
 
+    Each visitor returns a PrintNode, and both outputs are rendered from that
+    intermediate representation.
+
     Attributes:
-        _ast (str): Current AST string representation.
-        _visited_nodes (PySet[str]): Set of processed node IDs.
-        _ast_directory_cleared (bool): Flag indicating if output directory is cleared.
-        _node_counter (int): Counter for generating unique node IDs.
+        _ast (Optional[str]): Current AST string representation, or None until
+            it is first requested.
+        _ir (Optional[PrintNode]): Intermediate representation of the current AST.
+        _produced (Set[Path]): Output files written or confirmed up to date so far.
         _output_dir (Path): Directory path for saving visualization outputs.
+        _dispatch (Dict[type, Callable[[Any], PrintNode]]): Visitor method for each
+            node type.
     """
 
     def __init__(self) -> None:
         """
         Initialize the AST printer with empty state for visualization generation.
         """
-        self._ast: str = ""
-        self._visited_nodes: PySet[str] = set()
-        self._ast_directory_cleared: bool = False
-        self._node_counter: int = 0
+        self._ast: Optional[str] = None
+        self._ir: Optional[PrintNode] = None
+        self._produced: Set[Path] = set()
         self._output_dir: Path = (
             Path(__file__).parent.parent / "assets" / "images" / "ast"
         )
+        self._dispatch: Dict[type, Callable[[Any], PrintNode]] = {
+            Assign: self.visit_assign_expr,
+            Binary: self.visit_binary_expr,
+            Call: self.visit_call_expr,
+            Conditional: self.visit_conditional_expr,
+            Get: self.visit_get_expr,
+            Grouping: self.visit_grouping_expr,
+            Literal: self.visit_literal_expr,
+            Logical: self.visit_logical_expr,
+            ExprSet: self.visit_set_expr,
+            Super: self.visit_super_expr,
+            This: self.visit_this_expr,
+            Unary: self.visit_unary_expr,
+            Variable: self.visit_variable_expr,
+            Block: self.visit_block_stmt,
+            Break: self.visit_break_stmt,
+            Class: self.visit_class_stmt,
+            Expression: self.visit_expression_stmt,
+            Function: self.visit_function_stmt,
+            If: self.visit_if_stmt,
+            Print: self.visit_print_stmt,
+            Return: self.visit_return_stmt,
+            Trait: self.visit_trait_stmt,
+            Var: self.visit_var_stmt,
+            While: self.visit_while_stmt,
+        }
 
     @property
     def ast(self) -> str:
         """
-        Get the current AST string representation.
+        Get the current AST string representation, rendering it on first use.
 
         Returns:
             str: The current AST string representation.
         """
+        if self._ast is None:
+            self._ast = render_text(self._ir) if self._ir else ""
         return self._ast
 
-    def create_ast(self, statement: Optional[Stmt]) -> None:
+    @property
+    def ir(self) -> Optional[PrintNode]:
+        """
+        Get the intermediate representation of the current AST.
+
+        Returns:
+            Optional[PrintNode]: The current AST's root node, if any.
         """
-        Generate the AST string representation for a given statement.
+        return self._ir
+
+    def create_ast(self, statement: Optional[Union[Expr, Stmt]]) -> None:
+        """
+        Generate the AST representation for a given statement or expression.
+
+        Only the intermediate representation is built here; the string form is
+        rendered on first access to `ast`.
 
         Args:
-            statement (Optional[Stmt]): The root statement to process.
+            statement (Optional[Union[Expr, Stmt]]): The root node to process.
                 If None, sets empty string.
         """
-        self._ast = statement.accept(self) if statement else ""
+        self._ir = self._node(statement) if statement is not None else None
+        self._ast = None
 
     def visualize_ast(self, statement_number: int = 0) -> None:
         """
         Create and save a visual representation of the AST as an image.
 
+        Rendering is skipped when the image was already produced from the same
+        graph, as recorded by a content hash stored next to it.
+
         Args:
             statement_number (int, optional): Identifier for the statement,
                 used in output filename. Defaults to 0.
         """
-        if not self._ast_directory_cleared:
-            self._clear_ast_directory()
-            self._ast_directory_cleared = True
-
-        graph = AGraph(strict=True, directed=True)
-        self._parse_expression(self._ast, graph)
-
-        self._output_dir.mkdir(parents=True, exist_ok=True)
+        dot = _statement_dot(self._ir)
         output_file = self._output_dir / f"ast_statement_{statement_number}.png"
+        digest = _digest(dot)
+        if self._is_up_to_date(output_file, digest):
+            return
 
-        graph.layout(prog="dot")
-        graph.draw(str(output_file))
-        print(f"AST image saved to {output_file}")
-
-    def _clear_ast_directory(self) -> None:
-        """
-        Remove and recreate the AST output directory to ensure clean state.
-        """
-        if self._output_dir.exists():
-            shutil.rmtree(self._output_dir)
         self._output_dir.mkdir(parents=True, exist_ok=True)
+        _draw_dot((dot, str(output_file)))
+        self._saved(output_file, digest)
 
-    def _split_expression(self, expr: str) -> List[str]:
-        """
-        Split a parenthesized AST string into its component parts.
-
-        Args:
-            expr (str): The AST string expression to split.
-
-        Returns:
-            List[str]: List of individual expression components.
-        """
-        parts: List[str] = []
-        depth: int = 0
-        current: str = ""
-        in_string: bool = False
-
-        for char in expr:
-            if char == "(" and not in_string:
-                if depth == 0 and current.strip():
-                    parts.append(current.strip())
-                    current = ""
-                depth += 1
-                current += char
-            elif char == ")" and not in_string:
-                depth -= 1
-                current += char
-                if depth == 0:
-                    parts.append(current.strip())
-                    current = ""
-            elif char == '"':
-                in_string = not in_string
-                current += char
-                if not in_string and depth == 0:
-                    parts.append(current)
-                    current = ""
-            elif char == " " and depth == 0 and not in_string:
-                if current.strip():
-                    parts.append(current.strip())
-                current = ""
-            else:
-                current += char
-
-        if current.strip():
-            parts.append(current.strip())
-
-        return parts
-
-    def _parse_expression(
-        self,
-        expression: str,
-        graph: AGraph,
-        parent: Optional[str] = None,
+    def visualize_many(
+        self, statements: List[Stmt], max_workers: Optional[int] = None
     ) -> None:
         """
-        Recursively parse the AST string and construct the visualization graph.
+        Save one image per statement, laying the graphs out in parallel.
+
+        The DOT text of every statement is built in this process, and the
+        independent graphviz layouts run in a process pool. Images that are
+        already up to date are skipped as in `visualize_ast`.
 
         Args:
-            expression (str): The expression segment to parse.
-            graph (AGraph): The graph being constructed.
-            parent (Optional[str], optional): The parent node ID if any. Defaults to None.
+            statements (List[Stmt]): The statements to visualize, numbered
+                from 0 in the output filenames.
+            max_workers (Optional[int]): Maximum number of worker processes.
+                Defaults to the number of processors.
         """
-        if self._node_counter > 1000:  # Prevent infinite recursion
-            return
+        jobs: List[Tuple[str, str]] = []
+        digests: List[str] = []
+        for i, statement in enumerate(statements):
+            dot = _statement_dot(self._node(statement))
+            output_file = self._output_dir / f"ast_statement_{i}.png"
+            digest = _digest(dot)
+            if not self._is_up_to_date(output_file, digest):
+                jobs.append((dot, str(output_file)))
+                digests.append(digest)
 
-        expression = expression.strip()
-        if not expression:
+        if not jobs:
             return
 
-        if expression.startswith("("):
-            self._parse_parenthesized_expr(expression, graph, parent)
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        if len(jobs) == 1:
+            _draw_dot(jobs[0])
         else:
-            self._parse_literal_expr(expression, graph, parent)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_draw_dot, jobs))
 
-    def _parse_parenthesized_expr(
-        self,
-        expression: str,
-        graph: AGraph,
-        parent: Optional[str] = None,
-    ) -> None:
+        for (_, output_path), digest in zip(jobs, digests):
+            self._saved(Path(output_path), digest)
+
+    def visualize_all(self, statements: List[Stmt]) -> None:
         """
-        Parse a parenthesized expression and add corresponding nodes to the graph.
+        Render the ASTs of several statements into a single PDF document.
+
+        Every statement becomes a labelled cluster of one graph, so graphviz
+        lays out the whole program in one pass instead of once per statement.
 
         Args:
-            expression (str): The parenthesized expression to parse.
-            graph (AGraph): The graph being constructed.
-            parent (Optional[str], optional): The parent node ID if any. Defaults to None.
+            statements (List[Stmt]): The statements to visualize.
         """
-        expr_content = expression[1:-1].strip()
-        space_idx = expr_content.find(" ")
-
-        if expr_content.startswith('"') and expr_content.endswith('"'):
-            operator = expr_content
-            remaining = ""
-        else:
-            operator = expr_content[:space_idx] if space_idx != -1 else expr_content
-            remaining = expr_content[space_idx + 1 :] if space_idx != -1 else ""
+        out = ["strict digraph {"]
+        ids = count(1)
+        for i, statement in enumerate(statements):
+            out.append(f"subgraph cluster_{i} {{")
+            out.append(f'label="stmt {i}";')
+            render_dot(self._node(statement), out, ids=ids)
+            out.append("}")
+        out.append("}")
 
-        node = self._create_graph_node(operator)
-        if node.id in self._visited_nodes:
+        dot = "\n".join(out)
+        output_file = self._output_dir / "all.pdf"
+        digest = _digest(dot)
+        if self._is_up_to_date(output_file, digest):
             return
 
-        self._visited_nodes.add(node.id)
-        graph.add_node(node.id, label=node.label)
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        _draw_dot((dot, str(output_file)))
+        self._saved(output_file, digest)
 
-        if parent:
-            graph.add_edge(parent, node.id)
+    def _is_up_to_date(self, output_file: Path, digest: str) -> bool:
+        """
+        Check whether an output file was already drawn from the same graph.
 
-        if remaining:
-            for child_expr in self._split_expression(remaining):
-                self._parse_expression(child_expr, graph, node.id)
+        Args:
+            output_file (Path): The image the graph would be drawn to.
+            digest (str): Hash of the graph's DOT text.
 
-    def _parse_literal_expr(
-        self,
-        expression: str,
-        graph: AGraph,
-        parent: Optional[str] = None,
-    ) -> None:
+        Returns:
+            bool: True if the image exists and its stored hash matches `digest`.
+        """
+        hash_file = output_file.with_suffix(".hash")
+        self._produced.update((output_file, hash_file))
+
+        if (
+            output_file.exists()
+            and hash_file.exists()
+            and hash_file.read_text() == digest
+        ):
+            print(f"AST image up to date at {output_file}")
+            return True
+        return False
+
+    def _saved(self, output_file: Path, digest: str) -> None:
         """
-        Parse a literal expression and add it to the visualization graph.
+        Record the hash of a freshly drawn image and report it.
 
         Args:
-            expression (str): The literal expression to parse.
-            graph (AGraph): The graph being constructed.
-            parent (Optional[str], optional): The parent node ID if any. Defaults to None.
+            output_file (Path): The image that was drawn.
+            digest (str): Hash of the graph's DOT text.
         """
-        node = self._create_graph_node(expression)
-        graph.add_node(node.id, label=node.label)
-        if parent:
-            graph.add_edge(parent, node.id)
+        output_file.with_suffix(".hash").write_text(digest)
+        print(f"AST image saved to {output_file}")
 
-    def _create_graph_node(self, value: str) -> GraphNode:
+    def prune_stale_images(self) -> None:
         """
-        Create a new graph node with appropriate labeling for visualization.
+        Remove AST images and hash files from the output directory that were
+        not produced by `visualize_ast` or `visualize_all`, such as images of
+        statements that no longer exist. Other files are left untouched.
 
-        Args:
-            value (str): The value to create a node for.
+        The directory is listed once, and each entry is matched against all
+        output patterns.
+        """
+        try:
+            entries = list(os.scandir(self._output_dir))
+        except FileNotFoundError:
+            return
 
-        Returns:
-            GraphNode: A new graph node instance with generated ID and label.
+        for entry in entries:
+            if _OUTPUT_RE.match(entry.name):
+                path = self._output_dir / entry.name
+                if path not in self._produced:
+                    os.unlink(entry.path)
+
+    def _node(self, child: Any) -> PrintNode:
         """
-        self._node_counter += 1
-        node_id = f"node{self._node_counter}"
+        Convert a single child into a PrintNode.
 
-        if value.startswith('"') and value.endswith('"'):
-            label = f"String: {value}"
-        elif value.replace(".", "", 1).isdigit():
-            label = f"Number: {value}"
-        else:
-            label = value
+        Args:
+            child (Any): An AST node, token, or plain value.
 
-        return GraphNode(node_id, label)
+        Returns:
+            PrintNode: The node for the child; tokens and values become names.
+        """
+        child_type = type(child)
+        visit = self._dispatch.get(child_type)
+        if visit is not None:
+            return visit(child)
+        if child_type is Token:
+            return PrintNode("name", sys.intern(child.lexeme))
+        if isinstance(child, (Expr, Stmt)):
+            return child.accept(self)
+        return PrintNode("name", str(child))
 
-    def _parenthesize(self, name: str, *exprs: Any) -> str:
+    def _parenthesize(self, kind: str, name: str, *exprs: Any) -> PrintNode:
         """
-        Create a parenthesized string representation of an AST node.
+        Create a parenthesized node with the given children.
+
+        Used by the variadic and less frequent visitors; the hot fixed-arity
+        visitors build their PrintNode directly.
 
         Args:
+            kind (str): The kind of AST node.
             name (str): The name of the AST node.
             *exprs (Any): The child expressions or tokens.
 
         Returns:
-            str: Parenthesized string representation of the node.
+            PrintNode: The node representing the AST node.
         """
-        parts: List[str] = [name]
-
-        for expr in exprs:
-            if isinstance(expr, (Expr, Stmt)):
-                parts.append(str(expr.accept(self)))
-            elif isinstance(expr, Token):
-                parts.append(expr.lexeme)
-            elif isinstance(expr, list):
-                parts.extend(str(stmt.accept(self)) for stmt in expr)
-            else:
-                parts.append(str(expr))
-
-        return f"({' '.join(parts)})"
+        return PrintNode(kind, sys.intern(name), [self._node(expr) for expr in exprs])
 
     # Expression visitor methods
-    def visit_binary_expr(self, expr: Binary) -> str:
+    def visit_binary_expr(self, expr: Binary) -> PrintNode:
         """
-        Visit a binary expression node and create its string representation.
+        Visit a binary expression node and create its representation.
 
         Args:
             expr (Binary): The binary expression to visit.
 
         Returns:
-            str: String representation of the binary expression.
+            PrintNode: Representation of the binary expression.
         """
-        return self._parenthesize(expr.operator.lexeme, expr.left, expr.right)
+        return PrintNode(
+            "binary",
+            sys.intern(expr.operator.lexeme),
+            [self._node(expr.left), self._node(expr.right)],
+        )
 
-    def visit_call_expr(self, expr: Call) -> str:
+    def visit_call_expr(self, expr: Call) -> PrintNode:
         """
-        Visit a call expression node and create its string representation.
+        Visit a call expression node and create its representation.
 
         Args:
             expr (Call): The call expression to visit.
 
         Returns:
-            str: String representation of the call expression.
+            PrintNode: Representation of the call expression.
         """
-        return self._parenthesize("call", expr.callee, *expr.arguments)
+        return self._parenthesize("call", "call", expr.callee, *expr.arguments)
 
-    def visit_get_expr(self, expr: Get) -> str:
+    def visit_get_expr(self, expr: Get) -> PrintNode:
         """
-        Visit a get expression node and create its string representation.
+        Visit a get expression node and create its representation.
 
         Args:
             expr (Get): The get expression to visit.
 
         Returns:
-            str: String representation of the get expression.
+            PrintNode: Representation of the get expression.
         """
-        return self._parenthesize(".", expr.object, expr.name.lexeme)
+        return PrintNode(
+            "get",
+            ".",
+            [self._node(expr.object), PrintNode("name", sys.intern(expr.name.lexeme))],
+        )
 
-    def visit_grouping_expr(self, expr: Grouping) -> str:
+    def visit_grouping_expr(self, expr: Grouping) -> PrintNode:
         """
-        Visit a grouping expression node and create its string representation.
+        Visit a grouping expression node and create its representation.
 
         Args:
             expr (Grouping): The grouping expression to visit.
 
         Returns:
-            str: String representation of the grouping expression.
+            PrintNode: Representation of the grouping expression.
         """
-        return self._parenthesize("group", expr.expression)
+        return PrintNode("grouping", "group", [self._node(expr.expression)])
 
-    def visit_literal_expr(self, expr: Literal) -> str:
+    def visit_literal_expr(self, expr: Literal) -> PrintNode:
         """
-        Visit a literal expression node and create its string representation.
+        Visit a literal expression node and create its representation.
+
+        Literals never change, so the node is built once and cached on the
+        expression; printing the same AST again reuses it.
 
         Args:
             expr (Literal): The literal expression to visit.
 
         Returns:
-            str: String representation of the literal value.
-        """
-        if expr.value is None:
-            return "nil"
-        return f'"{expr.value}"' if isinstance(expr.value, str) else str(expr.value)
+            PrintNode: Representation of the literal value, typed by the value.
+        """
+        node = expr.printed
+        if node is not None:
+            return node
+
+        value = expr.value
+        if value is None:
+            node = PrintNode("nil", "nil")
+        elif isinstance(value, str):
+            node = PrintNode("string", value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            node = PrintNode("number", str(value))
+        else:
+            node = PrintNode("value", str(value))
+        expr.printed = node
+        return node
 
-    def visit_logical_expr(self, expr: Logical) -> str:
+    def visit_logical_expr(self, expr: Logical) -> PrintNode:
         """
-        Visit a logical expression node and create its string representation.
+        Visit a logical expression node and create its representation.
 
         Args:
             expr (Logical): The logical expression to visit.
 
         Returns:
-            str: String representation of the logical expression.
+            PrintNode: Representation of the logical expression.
         """
-        return self._parenthesize(expr.operator.lexeme, expr.left, expr.right)
+        return PrintNode(
+            "logical",
+            sys.intern(expr.operator.lexeme),
+            [self._node(expr.left), self._node(expr.right)],
+        )
 
-    def visit_set_expr(self, expr: ExprSet) -> str:
+    def visit_set_expr(self, expr: ExprSet) -> PrintNode:
         """
-        Visit a set expression node and create its string representation.
+        Visit a set expression node and create its representation.
 
         Args:
             expr (ExprSet): The set expression to visit.
 
         Returns:
-            str: String representation of the set expression.
+            PrintNode: Representation of the set expression.
         """
-        return self._parenthesize("set", expr.object, expr.name.lexeme, expr.value)
+        return self._parenthesize("set", "set", expr.object, expr.name, expr.value)
 
-    def visit_super_expr(self, expr: Super) -> str:
+    def visit_super_expr(self, expr: Super) -> PrintNode:
         """
-        Visit a super expression node and create its string representation.
+        Visit a super expression node and create its representation.
 
         Args:
             expr (Super): The super expression to visit.
 
         Returns:
-            str: String representation of the super expression.
+            PrintNode: Representation of the super expression.
         """
-        return self._parenthesize("super", expr.method)
+        return self._parenthesize("super", "super", expr.method)
 
-    def visit_this_expr(self, expr: This) -> str:
+    def visit_this_expr(self, expr: This) -> PrintNode:
         """
-        Visit a this expression node and create its string representation.
+        Visit a this expression node and create its representation.
 
         Args:
             expr (This): The this expression to visit.
 
         Returns:
-            str: The string "this".
+            PrintNode: A leaf node labelled "this".
         """
-        return "this"
+        return PrintNode("this", "this")
 
-    def visit_unary_expr(self, expr: Unary) -> str:
+    def visit_unary_expr(self, expr: Unary) -> PrintNode:
         """
-        Visit a unary expression node and create its string representation.
+        Visit a unary expression node and create its representation.
 
         Args:
             expr (Unary): The unary expression to visit.
 
         Returns:
-            str: String representation of the unary expression.
+            PrintNode: Representation of the unary expression.
         """
-        return self._parenthesize(expr.operator.lexeme, expr.right)
+        return PrintNode(
+            "unary", sys.intern(expr.operator.lexeme), [self._node(expr.right)]
+        )
 
-    def visit_variable_expr(self, expr: Variable) -> str:
+    def visit_variable_expr(self, expr: Variable) -> PrintNode:
         """
-        Visit a variable expression node and create its string representation.
+        Visit a variable expression node and create its representation.
 
         Args:
             expr (Variable): The variable expression to visit.
 
         Returns:
-            str: The lexeme of the variable name.
+            PrintNode: A leaf node labelled with the variable name.
         """
-        return expr.name.lexeme
+        return PrintNode("variable", sys.intern(expr.name.lexeme))
 
-    def visit_assign_expr(self, expr: Assign) -> str:
+    def visit_assign_expr(self, expr: Assign) -> PrintNode:
         """
-        Visit an assign expression node and create its string representation.
+        Visit an assign expression node and create its representation.
 
         Args:
             expr (Assign): The assign expression to visit.
 
         Returns:
-            str: String representation of the assignment expression.
+            PrintNode: Representation of the assignment expression.
         """
-        return self._parenthesize("=", expr.name.lexeme, expr.value)
+        return PrintNode(
+            "assign",
+            "=",
+            [PrintNode("name", sys.intern(expr.name.lexeme)), self._node(expr.value)],
+        )
 
-    def visit_conditional_expr(self, expr: Conditional) -> str:
+    def visit_conditional_expr(self, expr: Conditional) -> PrintNode:
         """
-        Visit a conditional (ternary) expression node and create its string representation.
+        Visit a conditional (ternary) expression node and create its representation.
 
         Args:
             expr (Conditional): The conditional expression to visit.
 
         Returns:
-            str: String representation of the conditional expression.
+            PrintNode: Representation of the conditional expression.
         """
         return self._parenthesize(
-            "?:", expr.condition, expr.then_branch, expr.else_branch
+            "conditional", "?:", expr.condition, expr.then_branch, expr.else_branch
         )
 
     # Statement visitor methods
-    def visit_expression_stmt(self, stmt: Expression) -> str:
+    def visit_expression_stmt(self, stmt: Expression) -> PrintNode:
         """
-        Visit an expression statement node and create its string representation.
+        Visit an expression statement node and create its representation.
 
         Args:
             stmt (Expression): The expression statement to visit.
 
         Returns:
-            str: String representation of the expression statement.
+            PrintNode: Representation of the expression statement.
         """
-        return self._parenthesize("expr", stmt.expression)
+        return PrintNode("expression", "expr", [self._node(stmt.expression)])
 
-    def visit_print_stmt(self, stmt: Print) -> str:
+    def visit_print_stmt(self, stmt: Print) -> PrintNode:
         """
-        Visit a print statement node and create its string representation.
+        Visit a print statement node and create its representation.
 
         Args:
             stmt (Print): The print statement to visit.
 
         Returns:
-            str: String representation of the print statement.
+            PrintNode: Representation of the print statement.
         """
-        return self._parenthesize("print", stmt.expression)
+        return PrintNode("print", "print", [self._node(stmt.expression)])
 
-    def visit_var_stmt(self, stmt: Var) -> str:
+    def visit_var_stmt(self, stmt: Var) -> PrintNode:
         """
-        Visit a variable declaration node and create its string representation.
+        Visit a variable declaration node and create its representation.
 
         Args:
             stmt (Var): The variable declaration to visit.
 
         Returns:
-            str: String representation of the variable declaration.
+            PrintNode: Representation of the variable declaration.
         """
-        return (
-            self._parenthesize("var", stmt.name.lexeme, stmt.initializer)
-            if stmt.initializer
-            else self._parenthesize("var", stmt.name.lexeme)
-        )
+        if stmt.initializer:
+            return self._parenthesize("var", "var", stmt.name, stmt.initializer)
+        return self._parenthesize("var", "var", stmt.name)
 
-    def visit_block_stmt(self, stmt: Block) -> str:
+    def visit_block_stmt(self, stmt: Block) -> PrintNode:
         """
-        Visit a block statement node and create its string representation.
+        Visit a block statement node and create its representation.
 
         Args:
             stmt (Block): The block statement to visit.
 
         Returns:
-            str: String representation of the block statement.
+            PrintNode: Representation of the block statement.
         """
-        return self._parenthesize("block", *stmt.statements)
+        return self._parenthesize("block", "block", *stmt.statements)
 
-    def visit_if_stmt(self, stmt: If) -> str:
+    def visit_if_stmt(self, stmt: If) -> PrintNode:
         """
-        Visit an if statement node and create its string representation.
+        Visit an if statement node and create its representation.
 
         Args:
             stmt (If): The if statement to visit.
 
         Returns:
-            str: String representation of the if statement.
+            PrintNode: Representation of the if statement.
         """
         if stmt.else_branch:
             return self._parenthesize(
-                "if", stmt.condition, stmt.then_branch, stmt.else_branch
+                "if", "if", stmt.condition, stmt.then_branch, stmt.else_branch
             )
-        return self._parenthesize("if", stmt.condition, stmt.then_branch)
+        return self._parenthesize("if", "if", stmt.condition, stmt.then_branch)
 
-    def visit_while_stmt(self, stmt: While) -> str:
+    def visit_while_stmt(self, stmt: While) -> PrintNode:
         """
-        Visit a while statement node and create its string representation.
+        Visit a while statement node and create its representation.
 
         Args:
             stmt (While): The while statement to visit.
 
         Returns:
-            str: String representation of the while statement.
+            PrintNode: Representation of the while statement.
         """
-        return self._parenthesize("while", stmt.condition, stmt.body)
+        return self._parenthesize("while", "while", stmt.condition, stmt.body)
 
-    def visit_break_stmt(self, stmt: Break) -> str:
+    def visit_break_stmt(self, stmt: Break) -> PrintNode:
         """
-        Visit a break statement node and create its string representation.
+        Visit a break statement node and create its representation.
 
         Args:
             stmt (Break): The break statement to visit.
 
         Returns:
-            str: The string "(break)".
+            PrintNode: A childless node labelled "break".
         """
-        return "(break)"
+        return PrintNode("break", "break")
 
-    def visit_function_stmt(self, stmt: Function) -> str:
+    def visit_function_stmt(self, stmt: Function) -> PrintNode:
         """
-        Visit a function declaration node and create its string representation.
+        Visit a function declaration node and create its representation.
 
         Args:
             stmt (Function): The function declaration to visit.
 
         Returns:
-            str: String representation of the function declaration.
+            PrintNode: Representation of the function declaration.
         """
-        return self._parenthesize(f"fun {stmt.name.lexeme}", *stmt.body)
+        return self._parenthesize("function", "fun", stmt.name, *stmt.body)
 
-    def visit_return_stmt(self, stmt: Return) -> str:
+    def visit_return_stmt(self, stmt: Return) -> PrintNode:
         """
-        Visit a return statement node and create its string representation.
+        Visit a return statement node and create its representation.
 
         Args:
             stmt (Return): The return statement to visit.
 
         Returns:
-            str: String representation of the return statement.
+            PrintNode: Representation of the return statement.
         """
-        return self._parenthesize("return", stmt.value) if stmt.value else "(return)"
+        if stmt.value:
+            return self._parenthesize("return", "return", stmt.value)
+        return PrintNode("return", "return")
 
-    def visit_trait_stmt(self, stmt: Trait) -> str:
+    def visit_trait_stmt(self, stmt: Trait) -> PrintNode:
         """
-        Visit a trait declaration node and create its string representation.
+        Visit a trait declaration node and create its representation.
 
         Args:
             stmt (Trait): The trait declaration to visit.
 
         Returns:
-            str: String representation of the trait declaration.
+            PrintNode: Representation of the trait declaration.
         """
-        parts = ["trait", stmt.name.lexeme]
-
-        if stmt.traits:
-            parts.extend(["with"] + [str(trait.accept(self)) for trait in stmt.traits])
+        header = ["with", *stmt.traits] if stmt.traits else []
+        return self._parenthesize("trait", "trait", stmt.name, *header, *stmt.methods)
 
-        for method in stmt.methods:
-            parts.append(self.visit_function_stmt(method))
-
-        return self._parenthesize(*parts)
-
-    def visit_class_stmt(self, stmt: Class) -> str:
+    def visit_class_stmt(self, stmt: Class) -> PrintNode:
         """
-        Visit a class declaration node and create its string representation.
+        Visit a class declaration node and create its representation.
 
         Args:
             stmt (Class): The class declaration to visit.
 
         Returns:
-            str: String representation of the class declaration.
+            PrintNode: Representation of the class declaration.
         """
-        parts = ["class", stmt.name.lexeme]
+        header: List[Any] = [stmt.name]
         if stmt.superclass:
-            parts.extend(["inherits_from", stmt.superclass.name.lexeme])
-
-        for method in stmt.methods:
-            parts.append(self.visit_function_stmt(method))
+            header.extend(["inherits_from", stmt.superclass.name])
 
+        node = self._parenthesize("class", "class", *header, *stmt.methods)
         for class_method in stmt.class_methods:
-            parts.append(
-                self._parenthesize("class", self.visit_function_stmt(class_method))
+            node.children.append(
+                self._parenthesize("class_method", "class", class_method)
             )
-
-        return self._parenthesize(*parts)
+        return node
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, ClassVar, List
 
 if TYPE_CHECKING:
     from .interpreter import Interpreter
@@ -14,10 +14,16 @@ class LoxCallable(ABC):
     This class defines the interface for objects that can be called as functions
     within the Lox language. It requires implementing the `call`, `arity`,
     and `__str__` methods.
+
+    Attributes:
+        is_callable (bool): Always True. The interpreter looks this attribute up to
+            recognize callables, which is cheaper than an isinstance check against an ABC.
     """
 
     __slots__ = ()
 
+    is_callable: ClassVar[bool] = True
+
     @abstractmethod
     def call(self, interpreter: Interpreter, arguments: List[Any]) -> Any:
         """
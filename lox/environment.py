@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .error_handler import LoxRuntimeError
 from .tokens import Token
@@ -13,24 +13,54 @@ class Environment:
     This class manages variable bindings within a particular scope and handles variable resolution,
     including support for nested (enclosing) environments to facilitate lexical scoping.
 
+    Values are stored in a list of slots in the order they are defined. The resolver assigns
+    every local variable the same slot, so resolved accesses index the list directly; lookups
+    by name go through `slot_of`.
+
+    Every environment also caches the chain of environments enclosing it, so that an ancestor
+    at a resolved distance is reached by a single index instead of walking `enclosing` links.
+    Environments are never re-parented, which keeps the cache valid.
+
+    An environment whose variables are known in advance, such as a function call's, can be
+    created with a shared `slot_of` map, which gives it one slot per name up front. The
+    shared map is never modified: defining a name it does not hold first gives the
+    environment its own copy, so the other environments sharing the map keep their layout.
+
     Attributes:
         enclosing (Optional[Environment]): The parent environment that encloses the current scope.
             If `None`, this environment serves as the global scope.
-        values (Dict[str, Any]): A dictionary mapping variable names to their corresponding values
-            within the current environment.
+        values (List[Any]): The variable values of the current environment, indexed by slot.
+        slot_of (Dict[str, int]): A dictionary mapping variable names to their slots in `values`.
     """
 
-    __slots__ = ("enclosing", "values")
+    __slots__ = ("enclosing", "values", "slot_of", "_shared", "_ancestors")
 
-    def __init__(self, enclosing: Optional[Environment] = None) -> None:
+    def __init__(
+        self,
+        enclosing: Optional[Environment] = None,
+        slot_of: Optional[Dict[str, int]] = None,
+    ) -> None:
         """
         Initialize a new Environment instance.
 
         Args:
             enclosing (Optional[Environment]): The enclosing (parent) environment. Defaults to None.
+            slot_of (Optional[Dict[str, int]]): A shared map of the variables the environment
+                will hold to their slots, copied before a name is added to it. Defaults to
+                None, which starts an empty map of the environment's own.
         """
         self.enclosing = enclosing
-        self.values: Dict[str, Any] = {}
+        if slot_of is None:
+            self.values: List[Any] = []
+            self.slot_of: Dict[str, int] = {}
+            self._shared: bool = False
+        else:
+            self.values = [None] * len(slot_of)
+            self.slot_of = slot_of
+            self._shared = True
+        self._ancestors: Tuple[Environment, ...] = (self,) + (
+            enclosing._ancestors if enclosing is not None else ()
+        )
 
     def define(self, name: str, value: Any) -> None:
         """
@@ -40,7 +70,15 @@ class Environment:
             name (str): The name of the variable.
             value (Any): The value to assign to the variable.
         """
-        self.values[name] = value
+        slot = self.slot_of.get(name)
+        if slot is None:
+            if self._shared:
+                self.slot_of = dict(self.slot_of)
+                self._shared = False
+            self.slot_of[name] = len(self.values)
+            self.values.append(value)
+        else:
+            self.values[slot] = value
 
     def get(self, name: Token) -> Any:
         """
@@ -55,8 +93,9 @@ class Environment:
         Raises:
             LoxRuntimeError: If the variable is undefined in the current or enclosing environments.
         """
-        if name.lexeme in self.values:
-            return self.values[name.lexeme]
+        slot = self.slot_of.get(name.lexeme)
+        if slot is not None:
+            return self.values[slot]
 
         if self.enclosing is not None:
             return self.enclosing.get(name)
@@ -74,8 +113,9 @@ class Environment:
         Raises:
             LoxRuntimeError: If the variable is undefined in the current or enclosing environments.
         """
-        if name.lexeme in self.values:
-            self.values[name.lexeme] = value
+        slot = self.slot_of.get(name.lexeme)
+        if slot is not None:
+            self.values[slot] = value
             return
 
         if self.enclosing is not None:
@@ -86,7 +126,7 @@ class Environment:
 
     def _ancestor(self, distance: int) -> Environment:
         """
-        Traverse up the chain of enclosing environments to find an ancestor at a specific distance.
+        Find the enclosing environment at a specific distance.
 
         Args:
             distance (int): The number of environments to traverse upwards.
@@ -97,11 +137,10 @@ class Environment:
         Raises:
             AssertionError: If an enclosing environment does not exist at the specified distance.
         """
-        environment: Environment = self
-        for _ in range(distance):
-            assert environment.enclosing is not None, "Enclosing environment is None."
-            environment = environment.enclosing
-        return environment
+        try:
+            return self._ancestors[distance]
+        except IndexError:
+            raise AssertionError("Enclosing environment is None.") from None
 
     def get_at(self, distance: int, name: str) -> Any:
         """
@@ -115,7 +154,8 @@ class Environment:
             Any: The value of the variable.
         """
         ancestor = self._ancestor(distance)
-        return ancestor.values.get(name)
+        slot = ancestor.slot_of.get(name)
+        return None if slot is None else ancestor.values[slot]
 
     def assign_at(self, distance: int, name: Token, value: Any) -> None:
         """
@@ -126,5 +166,28 @@ class Environment:
             name (Token): The token representing the variable's name.
             value (Any): The new value to assign to the variable.
         """
-        ancestor = self._ancestor(distance)
-        ancestor.values[name.lexeme] = value
+        self._ancestor(distance).define(name.lexeme, value)
+
+    def get_slot(self, distance: int, slot: int) -> Any:
+        """
+        Retrieve the value in a slot of an ancestor environment at a specific distance.
+
+        Args:
+            distance (int): The distance of the ancestor environment.
+            slot (int): The slot of the variable in that environment.
+
+        Returns:
+            Any: The value of the variable.
+        """
+        return self._ancestors[distance].values[slot]
+
+    def set_slot(self, distance: int, slot: int, value: Any) -> None:
+        """
+        Assign a new value to a slot of an ancestor environment at a specific distance.
+
+        Args:
+            distance (int): The distance of the ancestor environment.
+            slot (int): The slot of the variable in that environment.
+            value (Any): The new value to assign to the variable.
+        """
+        self._ancestors[distance].values[slot] = value
@@ -1,19 +1,11 @@
 from __future__ import annotations
 
 import traceback
-from typing import Any, List, Optional, Union
+from typing import List, Optional, Union
 
 from .tokens import Token
 
 
-class BreakException(Exception):
-    """
-    Exception used to signal a break statement in loops.
-    """
-
-    ...
-
-
 class LoxRuntimeError(RuntimeError):
     """
     Represents a runtime error in the Lox interpreter.
@@ -35,24 +27,6 @@ class LoxRuntimeError(RuntimeError):
         super().__init__(message)
         self.token = token
 
-    def __str__(self) -> str:
-        """
-        Return the string representation of the runtime error.
-
-        Returns:
-            str: The error message.
-        """
-        return super().__str__()
-
-    def __repr__(self) -> str:
-        """
-        Return the official string representation of the runtime error.
-
-        Returns:
-            str: The official string representation.
-        """
-        return super().__repr__()
-
 
 class ParseError(RuntimeError):
     """
@@ -60,43 +34,26 @@ class ParseError(RuntimeError):
 
     Attributes:
         token (Token): The token where the error occurred.
-        error_handler (ErrorHandler): The handler for managing errors.
+        error_handler (Optional[ErrorHandler]): The handler that reported the error, if any.
     """
 
     __slots__ = ("token", "error_handler")
 
-    def __init__(self, token: Token, message: str) -> None:
+    def __init__(
+        self, token: Token, message: str, error_handler: Optional[ErrorHandler] = None
+    ) -> None:
         """
         Initialize a ParseError with a specific token and message.
 
         Args:
             token (Token): The token where the error occurred.
             message (str): The error message.
+            error_handler (Optional[ErrorHandler]): The handler that reported the error.
+                Defaults to None.
         """
         super().__init__(message)
         self.token: Token = token
-        self.error_handler: ErrorHandler = ErrorHandler()
-
-
-class ReturnException(Exception):
-    """
-    Exception used to signal a return statement in functions.
-
-    Attributes:
-        value (Any): The value to return from the function.
-    """
-
-    __slots__ = ("value",)
-
-    def __init__(self, value: Any) -> None:
-        """
-        Initialize a ReturnException with a specific value.
-
-        Args:
-            value (Any): The value to return.
-        """
-        super().__init__()
-        self.value = value
+        self.error_handler: Optional[ErrorHandler] = error_handler
 
 
 class ErrorHandler:
@@ -126,10 +83,24 @@ class ErrorHandler:
         self.had_error = True
         self.errors.append(f"[{line_or_token}] Error: {message}")
 
+    def report_parse_error(self, token: Token, message: str) -> None:
+        """
+        Report a parse error that the parser can recover from in place.
+
+        Args:
+            token (Token): The token where the error occurred.
+            message (str): The error message.
+        """
+        self.error(token.line, message)
+        self.print_all_errors()
+
     def parse_error(self, token: Token, message: str) -> ParseError:
         """
         Report a parse error and return a ParseError exception.
 
+        Callers that only need the error reported should use
+        `report_parse_error`, which does not build an exception.
+
         Args:
             token (Token): The token where the error occurred.
             message (str): The error message.
@@ -137,9 +108,8 @@ class ErrorHandler:
         Returns:
             ParseError: The raised ParseError exception.
         """
-        self.error(token.line, message)
-        self.print_all_errors()
-        return ParseError(token, message)
+        self.report_parse_error(token, message)
+        return ParseError(token, message, self)
 
     def print_all_errors(self) -> None:
         """
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Any, Generic, List, Optional, TypeVar, override
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    override,
+)
 
 from .tokens import Token
 
 T = TypeVar("T")
 
 
-class ExprVisitor(ABC, Generic[T]):
+class ExprVisitor(Generic[T]):
     """
     Visitor interface for processing different types of expressions in the AST.
 
     This interface defines a visit method for each concrete expression type,
     allowing operations to be performed on expressions by implementing the visitor.
+    It is a plain base class rather than an ABC; visit methods that a visitor does
+    not override raise NotImplementedError.
 
     Methods:
         visit_binary_expr (Binary) -> T: Visit a Binary expression.
@@ -31,56 +42,60 @@ class ExprVisitor(ABC, Generic[T]):
         visit_conditional_expr (Conditional) -> T: Visit a Conditional expression.
     """
 
-    @abstractmethod
-    def visit_binary_expr(self, expr: Binary) -> T: ...
+    def visit_binary_expr(self, expr: Binary) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_call_expr(self, expr: Call) -> T: ...
+    def visit_call_expr(self, expr: Call) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_grouping_expr(self, expr: Grouping) -> T: ...
+    def visit_grouping_expr(self, expr: Grouping) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_literal_expr(self, expr: Literal) -> T: ...
+    def visit_literal_expr(self, expr: Literal) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_unary_expr(self, expr: Unary) -> T: ...
+    def visit_unary_expr(self, expr: Unary) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_variable_expr(self, expr: Variable) -> T: ...
+    def visit_variable_expr(self, expr: Variable) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_assign_expr(self, expr: Assign) -> T: ...
+    def visit_assign_expr(self, expr: Assign) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_logical_expr(self, expr: Logical) -> T: ...
+    def visit_logical_expr(self, expr: Logical) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_get_expr(self, expr: Get) -> T: ...
+    def visit_get_expr(self, expr: Get) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_set_expr(self, expr: Set) -> T: ...
+    def visit_set_expr(self, expr: Set) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_this_expr(self, expr: This) -> T: ...
+    def visit_this_expr(self, expr: This) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_super_expr(self, expr: Super) -> T: ...
+    def visit_super_expr(self, expr: Super) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_conditional_expr(self, expr: Conditional) -> T: ...
+    def visit_conditional_expr(self, expr: Conditional) -> T:
+        raise NotImplementedError
 
 
-class Expr(ABC):
+class Expr:
     """
-    Abstract base class for all expression nodes in the AST.
+    Base class for all expression nodes in the AST.
 
     This class defines the interface for expression nodes, requiring the
-    implementation of the accept method to accept visitors.
+    implementation of the accept method to accept visitors. It is not an ABC,
+    so creating nodes and isinstance checks avoid the ABCMeta machinery, and it
+    declares empty `__slots__` so that the slotted subclasses carry no `__dict__`.
     """
 
-    @abstractmethod
-    def accept(self, visitor: ExprVisitor[T]) -> T: ...
+    __slots__ = ()
+
+    def accept(self, visitor: ExprVisitor[T]) -> T:
+        raise NotImplementedError
 
 
 class Binary(Expr):
@@ -91,14 +106,18 @@ class Binary(Expr):
         left (Expr): The left operand.
         operator (Token): The operator token.
         right (Expr): The right operand.
+        operation (Optional[Callable[..., Any]]): The interpreter's implementation of the
+            operator, cached on the node the first time it is evaluated.
     """
 
-    __slots__ = ("left", "operator", "right")
+    __slots__ = ("left", "operator", "right", "operation")
+    __match_args__ = ("left", "operator", "right")
 
     def __init__(self, left: Expr, operator: Token, right: Expr) -> None:
         self.left: Expr = left
         self.operator: Token = operator
         self.right: Expr = right
+        self.operation: Optional[Callable[..., Any]] = None
 
     @override
     def accept(self, visitor: ExprVisitor[T]) -> T:
@@ -112,15 +131,21 @@ class Call(Expr):
     Attributes:
         callee (Expr): The expression being called.
         paren (Token): The closing parenthesis token.
-        arguments (List[Expr]): The list of argument expressions.
+        arguments (Tuple[Expr, ...]): The argument expressions.
+        last_callee (Any): The global callable this call last invoked, cached by the
+            interpreter when the callee is a global variable.
+        last_arity (int): The arity of `last_callee`, or -1 before the first call.
     """
 
-    __slots__ = ("callee", "paren", "arguments")
+    __slots__ = ("callee", "paren", "arguments", "last_callee", "last_arity")
+    __match_args__ = ("callee", "paren", "arguments")
 
-    def __init__(self, callee: Expr, paren: Token, arguments: List[Expr]) -> None:
+    def __init__(self, callee: Expr, paren: Token, arguments: Sequence[Expr]) -> None:
         self.callee: Expr = callee
         self.paren: Token = paren
-        self.arguments: List[Expr] = arguments
+        self.arguments: Tuple[Expr, ...] = tuple(arguments)
+        self.last_callee: Any = None
+        self.last_arity: int = -1
 
     @override
     def accept(self, visitor: ExprVisitor[T]) -> T:
@@ -137,6 +162,7 @@ class Get(Expr):
     """
 
     __slots__ = ("object", "name")
+    __match_args__ = ("object", "name")
 
     def __init__(self, object: Expr, name: Token) -> None:
         self.object: Expr = object
@@ -156,6 +182,7 @@ class Grouping(Expr):
     """
 
     __slots__ = ("expression",)
+    __match_args__ = ("expression",)
 
     def __init__(self, expression: Expr) -> None:
         self.expression: Expr = expression
@@ -171,18 +198,43 @@ class Literal(Expr):
 
     Attributes:
         value (Any): The literal value.
+        printed (Any): The AST printer's node for this literal, cached on first print.
     """
 
-    __slots__ = ("value",)
+    __slots__ = ("value", "printed")
+    __match_args__ = ("value",)
 
     def __init__(self, value: Any) -> None:
         self.value: Any = value
+        self.printed: Any = None
 
     @override
     def accept(self, visitor: ExprVisitor[T]) -> T:
         return visitor.visit_literal_expr(self)
 
 
+def make_literal(value: Any, literals: Dict[Tuple[type, Any], Literal]) -> Literal:
+    """
+    Get a Literal node for a value, reusing one node per distinct value.
+
+    Literal nodes are never modified after parsing, so every occurrence of a
+    constant such as `0`, `true` or `nil` can share the same node. The shared nodes
+    live in a table owned by the caller, such as a Parser, so that they are released
+    together with it. The table is keyed by type as well as value since 1.0 == True.
+
+    Args:
+        value (Any): The literal value.
+        literals (Dict[Tuple[type, Any], Literal]): The table of shared nodes to use.
+
+    Returns:
+        Literal: The shared node for the value, or a new node if the value is unhashable.
+    """
+    try:
+        return literals.setdefault((type(value), value), Literal(value))
+    except TypeError:
+        return Literal(value)
+
+
 class Set(Expr):
     """
     Represents a property assignment expression.
@@ -194,6 +246,7 @@ class Set(Expr):
     """
 
     __slots__ = ("object", "name", "value")
+    __match_args__ = ("object", "name", "value")
 
     def __init__(self, object: Expr, name: Token, value: Expr) -> None:
         self.object: Expr = object
@@ -212,13 +265,19 @@ class Super(Expr):
     Attributes:
         keyword (Token): The 'super' keyword token.
         method (Token): The method name token.
+        depth (int): The distance to the environment holding the 'super' variable, set by
+            the resolver, or -1 if it is a global.
+        slot (int): The slot of the 'super' variable in that environment.
     """
 
-    __slots__ = ("keyword", "method")
+    __slots__ = ("keyword", "method", "depth", "slot")
+    __match_args__ = ("keyword", "method")
 
     def __init__(self, keyword: Token, method: Token) -> None:
         self.keyword: Token = keyword
         self.method: Token = method
+        self.depth: int = -1
+        self.slot: int = -1
 
     @override
     def accept(self, visitor: ExprVisitor[T]) -> T:
@@ -231,12 +290,18 @@ class This(Expr):
 
     Attributes:
         keyword (Token): The 'this' keyword token.
+        depth (int): The distance to the environment holding the 'this' variable, set by
+            the resolver, or -1 if it is a global.
+        slot (int): The slot of the 'this' variable in that environment.
     """
 
-    __slots__ = ("keyword",)
+    __slots__ = ("keyword", "depth", "slot")
+    __match_args__ = ("keyword",)
 
     def __init__(self, keyword: Token) -> None:
         self.keyword: Token = keyword
+        self.depth: int = -1
+        self.slot: int = -1
 
     @override
     def accept(self, visitor: ExprVisitor[T]) -> T:
@@ -253,6 +318,7 @@ class Unary(Expr):
     """
 
     __slots__ = ("operator", "right")
+    __match_args__ = ("operator", "right")
 
     def __init__(self, operator: Token, right: Expr) -> None:
         self.operator: Token = operator
@@ -269,12 +335,18 @@ class Variable(Expr):
 
     Attributes:
         name (Token): The variable name token.
+        depth (int): The distance to the environment holding the variable, set by
+            the resolver, or -1 if it is a global.
+        slot (int): The slot of the variable in that environment.
     """
 
-    __slots__ = ("name",)
+    __slots__ = ("name", "depth", "slot")
+    __match_args__ = ("name",)
 
     def __init__(self, name: Token) -> None:
         self.name: Token = name
+        self.depth: int = -1
+        self.slot: int = -1
 
     @override
     def accept(self, visitor: ExprVisitor[T]) -> T:
@@ -288,13 +360,19 @@ class Assign(Expr):
     Attributes:
         name (Token): The variable name token.
         value (Expr): The expression representing the value to assign.
+        depth (int): The distance to the environment holding the variable, set by
+            the resolver, or -1 if it is a global.
+        slot (int): The slot of the variable in that environment.
     """
 
-    __slots__ = ("name", "value")
+    __slots__ = ("name", "value", "depth", "slot")
+    __match_args__ = ("name", "value")
 
     def __init__(self, name: Token, value: Expr) -> None:
         self.name: Token = name
         self.value: Expr = value
+        self.depth: int = -1
+        self.slot: int = -1
 
     @override
     def accept(self, visitor: ExprVisitor[T]) -> T:
@@ -312,6 +390,7 @@ class Logical(Expr):
     """
 
     __slots__ = ("left", "operator", "right")
+    __match_args__ = ("left", "operator", "right")
 
     def __init__(self, left: Expr, operator: Token, right: Expr) -> None:
         self.left: Expr = left
@@ -334,6 +413,7 @@ class Conditional(Expr):
     """
 
     __slots__ = ("condition", "then_branch", "else_branch")
+    __match_args__ = ("condition", "then_branch", "else_branch")
 
     def __init__(self, condition: Expr, then_branch: Expr, else_branch: Expr) -> None:
         self.condition: Expr = condition
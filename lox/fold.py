@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Sequence, Tuple, override
+
+from .error_handler import LoxRuntimeError
+from .expr import (
+    Assign,
+    Binary,
+    Call,
+    Conditional,
+    Expr,
+    ExprVisitor,
+    Get,
+    Grouping,
+    Literal,
+    Logical,
+    Set,
+    Super,
+    This,
+    Unary,
+    Variable,
+    make_literal,
+)
+from .interpreter import Interpreter
+from .stmt import (
+    Block,
+    Break,
+    Class,
+    Expression,
+    Function,
+    If,
+    Print,
+    Return,
+    Stmt,
+    StmtVisitor,
+    Trait,
+    Var,
+    While,
+)
+from .tokens import TokenType
+
+
+class ConstantFolder(ExprVisitor[Expr], StmtVisitor[None]):
+    """
+    Folds constant subexpressions of a parsed program into literals.
+
+    Unary and binary operations on literals are evaluated once, before the program
+    runs, by the interpreter's own visitor methods, so folding follows exactly the
+    runtime semantics. Operations that would raise a runtime error, such as a division
+    by zero, are left in place to fail when they are reached. Groupings are replaced
+    by the expression they contain, and logical and conditional expressions with a
+    literal condition are reduced to the branch that would be evaluated.
+
+    The folder runs after the resolver has accepted the program, so that a branch it
+    prunes has still been checked for static errors. Folding keeps the resolved nodes
+    that survive, so their depths and slots stay valid.
+
+    Statements are updated in place; expression visitors return the folded expression.
+
+    Attributes:
+        interpreter (Interpreter): The interpreter whose semantics are used for folding.
+        literals (Dict[Tuple[type, Any], Literal]): The shared Literal nodes created by
+            folding, see `make_literal`.
+    """
+
+    __slots__ = ("interpreter", "literals")
+
+    def __init__(self, interpreter: Interpreter) -> None:
+        """
+        Initializes the ConstantFolder.
+
+        Args:
+            interpreter (Interpreter): The interpreter whose semantics are used for folding.
+        """
+        self.interpreter: Interpreter = interpreter
+        self.literals: Dict[Tuple[type, Any], Literal] = {}
+
+    def fold(self, statements: Sequence[Stmt]) -> None:
+        """
+        Folds the constant subexpressions of a sequence of statements.
+
+        Args:
+            statements (Sequence[Stmt]): The statements to fold.
+        """
+        for statement in statements:
+            statement.accept(self)
+
+    def _fold(self, expr: Expr) -> Expr:
+        """
+        Folds a single expression.
+
+        Args:
+            expr (Expr): The expression to fold.
+
+        Returns:
+            Expr: The folded expression.
+        """
+        return expr.accept(self)
+
+    def _fold_optional(self, expr: Optional[Expr]) -> Optional[Expr]:
+        """
+        Folds an expression that may be absent.
+
+        Args:
+            expr (Optional[Expr]): The expression to fold, if any.
+
+        Returns:
+            Optional[Expr]: The folded expression, or None.
+        """
+        return None if expr is None else expr.accept(self)
+
+    def _evaluate(self, expr: Expr) -> Expr:
+        """
+        Evaluates an operation on literals, keeping it if evaluation fails.
+
+        Args:
+            expr (Expr): The operation, whose operands are all literals.
+
+        Returns:
+            Expr: A literal holding the result, or `expr` if it raises a runtime error.
+        """
+        try:
+            return make_literal(self.interpreter._evaluate(expr), self.literals)
+        except LoxRuntimeError:
+            return expr
+
+    # Expression visitor methods
+    @override
+    def visit_binary_expr(self, expr: Binary) -> Expr:
+        """
+        Folds a binary expression whose operands are literals.
+
+        String repetition is never folded, so that code which is never reached cannot
+        build a huge string ahead of time.
+
+        Args:
+            expr (Binary): The binary expression to fold.
+
+        Returns:
+            Expr: The folded expression.
+        """
+        expr.left = self._fold(expr.left)
+        expr.right = self._fold(expr.right)
+        match expr:
+            case Binary(Literal(str()), operator, _) if operator.type == TokenType.STAR:
+                return expr
+            case Binary(Literal(), _, Literal()):
+                return self._evaluate(expr)
+        return expr
+
+    @override
+    def visit_call_expr(self, expr: Call) -> Expr:
+        """
+        Folds the callee and arguments of a call expression.
+
+        Args:
+            expr (Call): The call expression to fold.
+
+        Returns:
+            Expr: The call expression.
+        """
+        expr.callee = self._fold(expr.callee)
+        expr.arguments = tuple(self._fold(argument) for argument in expr.arguments)
+        return expr
+
+    @override
+    def visit_get_expr(self, expr: Get) -> Expr:
+        """
+        Folds the object of a property access.
+
+        Args:
+            expr (Get): The get expression to fold.
+
+        Returns:
+            Expr: The get expression.
+        """
+        expr.object = self._fold(expr.object)
+        return expr
+
+    @override
+    def visit_grouping_expr(self, expr: Grouping) -> Expr:
+        """
+        Replaces a grouping with the expression it contains.
+
+        Args:
+            expr (Grouping): The grouping expression to fold.
+
+        Returns:
+            Expr: The folded inner expression.
+        """
+        return self._fold(expr.expression)
+
+    @override
+    def visit_literal_expr(self, expr: Literal) -> Expr:
+        """
+        Returns a literal unchanged.
+
+        Args:
+            expr (Literal): The literal expression.
+
+        Returns:
+            Expr: The literal expression.
+        """
+        return expr
+
+    @override
+    def visit_logical_expr(self, expr: Logical) -> Expr:
+        """
+        Folds a logical expression, reducing it when its left operand is a literal.
+
+        Args:
+            expr (Logical): The logical expression to fold.
+
+        Returns:
+            Expr: The folded expression.
+        """
+        expr.left = self._fold(expr.left)
+        expr.right = self._fold(expr.right)
+        match expr:
+            case Logical(Literal(value) as left, operator, right):
+                left_truthy: bool = self.interpreter._is_truthy(value)
+                if operator.type == TokenType.OR:
+                    return left if left_truthy else right
+                return right if left_truthy else left
+        return expr
+
+    @override
+    def visit_set_expr(self, expr: Set) -> Expr:
+        """
+        Folds the object and value of a property assignment.
+
+        Args:
+            expr (Set): The set expression to fold.
+
+        Returns:
+            Expr: The set expression.
+        """
+        expr.object = self._fold(expr.object)
+        expr.value = self._fold(expr.value)
+        return expr
+
+    @override
+    def visit_super_expr(self, expr: Super) -> Expr:
+        """
+        Returns a super expression unchanged.
+
+        Args:
+            expr (Super): The super expression.
+
+        Returns:
+            Expr: The super expression.
+        """
+        return expr
+
+    @override
+    def visit_this_expr(self, expr: This) -> Expr:
+        """
+        Returns a this expression unchanged.
+
+        Args:
+            expr (This): The this expression.
+
+        Returns:
+            Expr: The this expression.
+        """
+        return expr
+
+    @override
+    def visit_unary_expr(self, expr: Unary) -> Expr:
+        """
+        Folds a unary expression whose operand is a literal.
+
+        Args:
+            expr (Unary): The unary expression to fold.
+
+        Returns:
+            Expr: The folded expression.
+        """
+        expr.right = self._fold(expr.right)
+        match expr:
+            case Unary(_, Literal()):
+                return self._evaluate(expr)
+        return expr
+
+    @override
+    def visit_variable_expr(self, expr: Variable) -> Expr:
+        """
+        Returns a variable expression unchanged.
+
+        Args:
+            expr (Variable): The variable expression.
+
+        Returns:
+            Expr: The variable expression.
+        """
+        return expr
+
+    @override
+    def visit_assign_expr(self, expr: Assign) -> Expr:
+        """
+        Folds the value of an assignment.
+
+        Args:
+            expr (Assign): The assignment expression to fold.
+
+        Returns:
+            Expr: The assignment expression.
+        """
+        expr.value = self._fold(expr.value)
+        return expr
+
+    @override
+    def visit_conditional_expr(self, expr: Conditional) -> Expr:
+        """
+        Folds a conditional expression, reducing it when its condition is a literal.
+
+        Args:
+            expr (Conditional): The conditional expression to fold.
+
+        Returns:
+            Expr: The folded expression.
+        """
+        expr.condition = self._fold(expr.condition)
+        expr.then_branch = self._fold(expr.then_branch)
+        expr.else_branch = self._fold(expr.else_branch)
+        match expr:
+            case Conditional(Literal(value), then_branch, else_branch):
+                if self.interpreter._is_truthy(value):
+                    return then_branch
+                return else_branch
+        return expr
+
+    # Statement visitor methods
+    @override
+    def visit_expression_stmt(self, stmt: Expression) -> None:
+        """
+        Folds the expression of an expression statement.
+
+        Args:
+            stmt (Expression): The expression statement to fold.
+        """
+        stmt.expression = self._fold(stmt.expression)
+
+    @override
+    def visit_print_stmt(self, stmt: Print) -> None:
+        """
+        Folds the expression of a print statement.
+
+        Args:
+            stmt (Print): The print statement to fold.
+        """
+        stmt.expression = self._fold(stmt.expression)
+
+    @override
+    def visit_var_stmt(self, stmt: Var) -> None:
+        """
+        Folds the initializer of a variable declaration.
+
+        Args:
+            stmt (Var): The variable declaration to fold.
+        """
+        stmt.initializer = self._fold(stmt.initializer)
+
+    @override
+    def visit_block_stmt(self, stmt: Block) -> None:
+        """
+        Folds the statements of a block.
+
+        Args:
+            stmt (Block): The block statement to fold.
+        """
+        self.fold(stmt.statements)
+
+    @override
+    def visit_class_stmt(self, stmt: Class) -> None:
+        """
+        Folds the methods of a class declaration.
+
+        Args:
+            stmt (Class): The class declaration to fold.
+        """
+        self.fold(stmt.methods)
+        self.fold(stmt.class_methods)
+
+    @override
+    def visit_if_stmt(self, stmt: If) -> None:
+        """
+        Folds the condition and branches of an if statement.
+
+        Args:
+            stmt (If): The if statement to fold.
+        """
+        stmt.condition = self._fold(stmt.condition)
+        stmt.then_branch.accept(self)
+        if stmt.else_branch is not None:
+            stmt.else_branch.accept(self)
+
+    @override
+    def visit_while_stmt(self, stmt: While) -> None:
+        """
+        Folds the condition and body of a while statement.
+
+        Args:
+            stmt (While): The while statement to fold.
+        """
+        stmt.condition = self._fold(stmt.condition)
+        stmt.body.accept(self)
+
+    @override
+    def visit_break_stmt(self, stmt: Break) -> None:
+        """
+        Leaves a break statement unchanged.
+
+        Args:
+            stmt (Break): The break statement.
+        """
+        return None
+
+    @override
+    def visit_function_stmt(self, stmt: Function) -> None:
+        """
+        Folds the body of a function declaration.
+
+        Args:
+            stmt (Function): The function declaration to fold.
+        """
+        self.fold(stmt.body)
+
+    @override
+    def visit_return_stmt(self, stmt: Return) -> None:
+        """
+        Folds the value of a return statement.
+
+        Args:
+            stmt (Return): The return statement to fold.
+        """
+        stmt.value = self._fold_optional(stmt.value)
+
+    @override
+    def visit_trait_stmt(self, stmt: Trait) -> None:
+        """
+        Folds the methods of a trait declaration.
+
+        Args:
+            stmt (Trait): The trait declaration to fold.
+        """
+        self.fold(stmt.methods)
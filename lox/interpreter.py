@@ -1,9 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Final, List, Optional, cast, override
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    override,
+)
 
 from .environment import Environment
-from .error_handler import BreakException, LoxRuntimeError, ReturnException
+from .error_handler import LoxRuntimeError
 from .expr import (
     Assign,
     Binary,
@@ -59,13 +70,30 @@ from .stmt import (
     Var,
     While,
 )
+from .stringify import format_number
 from .tokens import Token, TokenType
 
-if TYPE_CHECKING:
-    from .lox_function import LoxFunction
+# Statements that unwind control flow return a signal instead of raising:
+# a (kind, value) pair that enclosing blocks pass up until a loop or a
+# function call consumes it. Ordinary statements return None.
+Signal = Tuple[int, Any]
+
+BREAK: Final[int] = 1
+RETURN: Final[int] = 2
+
+_BREAK_SIGNAL: Final[Signal] = (BREAK, None)
+
+# Operator types tested on hot paths, bound once so that each test is a global
+# lookup and an identity check instead of an attribute lookup on TokenType.
+_MINUS: Final[TokenType] = TokenType.MINUS
+_BANG: Final[TokenType] = TokenType.BANG
+_OR: Final[TokenType] = TokenType.OR
 
+# Evaluates a binary operator on already evaluated operands; see _BINARY_OPERATIONS.
+BinaryOperation = Callable[["Interpreter", Token, Any, Any], Any]
 
-class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
+
+class Interpreter(ExprVisitor[Any], StmtVisitor[Optional[Signal]]):
     """
     Interpreter for the Lox programming language.
 
@@ -76,15 +104,16 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
     Attributes:
         globals (Environment): The global environment containing global variables and functions.
         _environment (Environment): The current environment, which may be nested within other environments.
-        _locals (Dict[Expr, int]): A mapping of expressions to their resolved variable depth.
+        _block_environments (Optional[Dict[Block, Environment]]): The environments reusable
+            blocks ran in during the innermost loop being executed, or None outside loops.
     """
 
-    __slots__ = ("globals", "_environment", "_locals")
+    __slots__ = ("globals", "_environment", "_block_environments")
 
     def __init__(self) -> None:
         self.globals: Final[Environment] = Environment()
         self._environment: Environment = self.globals
-        self._locals: Dict[Expr, int] = {}
+        self._block_environments: Optional[Dict[Block, Environment]] = None
 
         # Define built-in functions
         builtins = {
@@ -113,20 +142,34 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         """
         Evaluate an expression.
 
+        Literals are the most common leaves, so their value is returned directly.
+        Other node types are looked up in _EXPR_VISITS, which calls the visit method
+        without the extra call through accept(); node types missing from the table
+        still go through accept().
+
         Args:
             expr (Optional[Expr]): The expression to evaluate.
 
         Returns:
             Any: The result of the evaluation.
         """
-        if expr is None:
-            return None
-        return expr.accept(self)
+        if type(expr) is Literal:
+            return expr.value
+        try:
+            visit = _EXPR_VISITS[type(expr)]
+        except KeyError:
+            if expr is None:
+                return None
+            return expr.accept(self)
+        return visit(self, expr)
 
     def _is_truthy(self, obj: Any) -> bool:
         """
         Determine if a value is truthy.
 
+        Lox follows Python's truthiness, so the interpreter tests values with a plain
+        `if` where it evaluates conditions; this method serves the other passes.
+
         Args:
             obj (Any): The object to evaluate.
 
@@ -135,48 +178,6 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         """
         return bool(obj)
 
-    def _is_equal(self, a: Any, b: Any) -> bool:
-        """
-        Check if two values are equal.
-
-        Args:
-            a (Any): The first value.
-            b (Any): The second value.
-
-        Returns:
-            bool: True if values are equal, False otherwise.
-        """
-        return a == b
-
-    def _check_number_operand(self, operator: Token, operand: Any) -> None:
-        """
-        Ensure that the operand is a number.
-
-        Args:
-            operator (Token): The operator token.
-            operand (Any): The operand to check.
-
-        Raises:
-            LoxRuntimeError: If the operand is not a number.
-        """
-        if not isinstance(operand, float):
-            raise LoxRuntimeError(operator, "Operand must be a number.")
-
-    def _check_number_operands(self, operator: Token, left: Any, right: Any) -> None:
-        """
-        Ensure that both operands are numbers.
-
-        Args:
-            operator (Token): The operator token.
-            left (Any): The left operand.
-            right (Any): The right operand.
-
-        Raises:
-            LoxRuntimeError: If either operand is not a number.
-        """
-        if not (isinstance(left, float) and isinstance(right, float)):
-            raise LoxRuntimeError(operator, "Operands must be numbers.")
-
     def _stringify(self, obj: Any) -> str:
         """
         Convert an object to its string representation.
@@ -195,25 +196,33 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
                 Token(TokenType.NIL, "nil", None, 0),
                 "Error: Variable access before initialization or assignment",
             )
-        if isinstance(obj, float):
-            return str(int(obj)) if obj % 1 == 0 else str(obj)
+        if type(obj) is float:
+            return format_number(obj)
         return str(obj)
 
-    def _execute(self, stmt: Stmt) -> None:
+    def _execute(self, stmt: Stmt) -> Optional[Signal]:
         """
         Execute a statement.
 
         Args:
             stmt (Stmt): The statement to execute.
+
+        Returns:
+            Optional[Signal]: The break or return signal raised by the statement, if any.
         """
-        stmt.accept(self)
+        return stmt.accept(self)
 
-    def _apply_trait(self, traits: List[Expr]) -> Dict[str, LoxFunction]:
+    def _apply_trait(self, stmt: Union[Class, Trait]) -> Dict[str, LoxFunction]:
         """
-        Apply traits to the current environment.
+        Apply the traits of a class or trait declaration to the current environment.
+
+        The merged methods are cached on the declaration together with the trait objects
+        they came from. When the declaration runs again, such as a class declared inside a
+        function, and its trait expressions evaluate to the same objects, the cached
+        methods are reused without checking them again.
 
         Args:
-            traits (List[Expr]): A list of trait expressions.
+            stmt (Union[Class, Trait]): The declaration whose traits are applied.
 
         Returns:
             Dict[str, LoxFunction]: A dictionary of method names to LoxFunction instances.
@@ -221,9 +230,17 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         Raises:
             RuntimeError: If a trait is invalid or if there are conflicting methods.
         """
+        trait_objs: Tuple[Any, ...] = tuple(
+            self._evaluate(trait_expr) for trait_expr in stmt.traits
+        )
+        applied = stmt.applied_traits
+        if applied is not None and all(
+            cached is obj for cached, obj in zip(applied[0], trait_objs)
+        ):
+            return dict(applied[1])
+
         methods: Dict[str, LoxFunction] = {}
-        for trait_expr in traits:
-            trait_obj: object = self._evaluate(trait_expr)
+        for trait_expr, trait_obj in zip(stmt.traits, trait_objs):
             if not isinstance(trait_obj, LoxTrait):
                 no_trait: Token = cast(Variable, trait_expr).name
                 raise RuntimeError(no_trait, f"{no_trait.lexeme} is not a trait.")
@@ -235,31 +252,49 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
                         f"Duplicate method '{name}' found in traits.",
                     )
                 methods[name] = method
-        return methods
+        stmt.applied_traits = (trait_objs, methods)
+        return dict(methods)
 
-    def resolve(self, expr: Expr, depth: int) -> None:
+    def resolve(
+        self, expr: Union[Variable, Assign, This, Super], depth: int, slot: int
+    ) -> None:
         """
-        Resolve the depth of a variable.
+        Resolve the location of a variable.
+
+        The depth and slot are stored on the expression itself, so looking a variable
+        up reads two attributes of the node instead of hashing it into a table.
 
         Args:
-            expr (Expr): The expression to resolve.
+            expr (Union[Variable, Assign, This, Super]): The expression to resolve.
             depth (int): The depth at which the variable is found.
+            slot (int): The slot of the variable in the environment at that depth.
         """
-        self._locals[expr] = depth
+        expr.depth = depth
+        expr.slot = slot
 
-    def _execute_block(self, statements: List[Stmt], environment: Environment) -> None:
+    def _execute_block(
+        self, statements: List[Stmt], environment: Environment
+    ) -> Optional[Signal]:
         """
         Execute a block of statements within a new environment.
 
+        Execution stops at the first statement that returns a signal.
+
         Args:
             statements (List[Stmt]): The statements to execute.
             environment (Environment): The new environment.
+
+        Returns:
+            Optional[Signal]: The break or return signal that ended the block, if any.
         """
         previous: Environment = self._environment
         try:
             self._environment = environment
             for statement in statements:
-                self._execute(statement)
+                signal = statement.accept(self)
+                if signal is not None:
+                    return signal
+            return None
         finally:
             self._environment = previous
 
@@ -318,12 +353,13 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         """
         right: Any = self._evaluate(expr.right)
 
-        match expr.operator.type:
-            case TokenType.MINUS:
-                self._check_number_operand(expr.operator, right)
-                return -right
-            case TokenType.BANG:
-                return not self._is_truthy(right)
+        operator_type: TokenType = expr.operator.type
+        if operator_type is _MINUS:
+            if type(right) is not float:
+                raise LoxRuntimeError(expr.operator, "Operand must be a number.")
+            return -right
+        elif operator_type is _BANG:
+            return not right
         return None
 
     @override
@@ -343,57 +379,223 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         left: Any = self._evaluate(expr.left)
         right: Any = self._evaluate(expr.right)
 
-        match expr.operator.type:
-            case TokenType.MINUS:
-                self._check_number_operands(expr.operator, left, right)
-                return left - right
-            case TokenType.SLASH:
-                self._check_number_operands(expr.operator, left, right)
-                if right == 0:
-                    raise LoxRuntimeError(expr.operator, "Division by zero.")
-                return left / right
-            case TokenType.STAR:
-                if isinstance(left, float) and isinstance(right, float):
-                    return cast(float, left) * cast(float, right)
-                elif isinstance(left, str) and isinstance(right, float):
-                    return cast(str, left) * int(right)
-                raise LoxRuntimeError(
-                    expr.operator, "Operands must be numbers or a string and a number."
-                )
-            case TokenType.MODULO:
-                self._check_number_operands(expr.operator, left, right)
-                if right == 0:
-                    raise LoxRuntimeError(expr.operator, "Division by zero.")
-                return left % right
-            case TokenType.PLUS:
-                if isinstance(left, float) and isinstance(right, float):
-                    return left + right
-                elif isinstance(left, str) and isinstance(right, str):
-                    return left + right
-                elif isinstance(left, str) and isinstance(right, float):
-                    return left + self._stringify(right)
-                elif isinstance(left, float) and isinstance(right, str):
-                    return self._stringify(left) + right
-                raise LoxRuntimeError(
-                    expr.operator, "Operands must be two numbers or two strings."
-                )
-            case TokenType.GREATER:
-                self._check_number_operands(expr.operator, left, right)
-                return left > right
-            case TokenType.GREATER_EQUAL:
-                self._check_number_operands(expr.operator, left, right)
-                return left >= right
-            case TokenType.LESS:
-                self._check_number_operands(expr.operator, left, right)
-                return left < right
-            case TokenType.LESS_EQUAL:
-                self._check_number_operands(expr.operator, left, right)
-                return left <= right
-            case TokenType.BANG_EQUAL:
-                return not self._is_equal(left, right)
-            case TokenType.EQUAL_EQUAL:
-                return self._is_equal(left, right)
-        return None
+        operation: Optional[BinaryOperation] = expr.operation
+        if operation is None:
+            operation = expr.operation = _BINARY_OPERATIONS[expr.operator.type]
+        return operation(self, expr.operator, left, right)
+
+    def _add(self, operator: Token, left: Any, right: Any) -> Any:
+        """
+        Add two numbers or concatenate two operands of which at least one is a string.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            Any: The sum or the concatenated string.
+
+        Raises:
+            LoxRuntimeError: If the operands are neither numbers nor strings.
+        """
+        if type(left) is float and type(right) is float:
+            return left + right
+        elif type(left) is str and type(right) is str:
+            return left + right
+        elif type(left) is str and type(right) is float:
+            return left + format_number(right)
+        elif type(left) is float and type(right) is str:
+            return format_number(left) + right
+        raise LoxRuntimeError(operator, "Operands must be two numbers or two strings.")
+
+    def _subtract(self, operator: Token, left: Any, right: Any) -> float:
+        """
+        Subtract two numbers.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            float: The difference.
+
+        Raises:
+            LoxRuntimeError: If either operand is not a number.
+        """
+        if type(left) is not float or type(right) is not float:
+            raise LoxRuntimeError(operator, "Operands must be numbers.")
+        return left - right
+
+    def _multiply(self, operator: Token, left: Any, right: Any) -> Any:
+        """
+        Multiply two numbers or repeat a string a number of times.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            Any: The product or the repeated string.
+
+        Raises:
+            LoxRuntimeError: If the operands are not two numbers or a string and a number.
+        """
+        if type(left) is float and type(right) is float:
+            return left * right
+        elif type(left) is str and type(right) is float:
+            return left * int(right)
+        raise LoxRuntimeError(
+            operator, "Operands must be numbers or a string and a number."
+        )
+
+    def _divide(self, operator: Token, left: Any, right: Any) -> float:
+        """
+        Divide two numbers.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            float: The quotient.
+
+        Raises:
+            LoxRuntimeError: If either operand is not a number or the divisor is zero.
+        """
+        if type(left) is not float or type(right) is not float:
+            raise LoxRuntimeError(operator, "Operands must be numbers.")
+        if right == 0:
+            raise LoxRuntimeError(operator, "Division by zero.")
+        return left / right
+
+    def _modulo(self, operator: Token, left: Any, right: Any) -> float:
+        """
+        Compute the remainder of dividing two numbers.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            float: The remainder.
+
+        Raises:
+            LoxRuntimeError: If either operand is not a number or the divisor is zero.
+        """
+        if type(left) is not float or type(right) is not float:
+            raise LoxRuntimeError(operator, "Operands must be numbers.")
+        if right == 0:
+            raise LoxRuntimeError(operator, "Division by zero.")
+        return left % right
+
+    def _greater(self, operator: Token, left: Any, right: Any) -> bool:
+        """
+        Check whether a number is greater than another.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            bool: The result of the comparison.
+
+        Raises:
+            LoxRuntimeError: If either operand is not a number.
+        """
+        if type(left) is not float or type(right) is not float:
+            raise LoxRuntimeError(operator, "Operands must be numbers.")
+        return left > right
+
+    def _greater_equal(self, operator: Token, left: Any, right: Any) -> bool:
+        """
+        Check whether a number is greater than or equal to another.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            bool: The result of the comparison.
+
+        Raises:
+            LoxRuntimeError: If either operand is not a number.
+        """
+        if type(left) is not float or type(right) is not float:
+            raise LoxRuntimeError(operator, "Operands must be numbers.")
+        return left >= right
+
+    def _less(self, operator: Token, left: Any, right: Any) -> bool:
+        """
+        Check whether a number is less than another.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            bool: The result of the comparison.
+
+        Raises:
+            LoxRuntimeError: If either operand is not a number.
+        """
+        if type(left) is not float or type(right) is not float:
+            raise LoxRuntimeError(operator, "Operands must be numbers.")
+        return left < right
+
+    def _less_equal(self, operator: Token, left: Any, right: Any) -> bool:
+        """
+        Check whether a number is less than or equal to another.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            bool: The result of the comparison.
+
+        Raises:
+            LoxRuntimeError: If either operand is not a number.
+        """
+        if type(left) is not float or type(right) is not float:
+            raise LoxRuntimeError(operator, "Operands must be numbers.")
+        return left <= right
+
+    def _equal(self, operator: Token, left: Any, right: Any) -> bool:
+        """
+        Check whether two values are equal.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            bool: True if the values are equal, False otherwise.
+        """
+        return left == right
+
+    def _not_equal(self, operator: Token, left: Any, right: Any) -> bool:
+        """
+        Check whether two values are not equal.
+
+        Args:
+            operator (Token): The operator token.
+            left (Any): The left operand.
+            right (Any): The right operand.
+
+        Returns:
+            bool: True if the values differ, False otherwise.
+        """
+        return left != right
 
     @override
     def visit_variable_expr(self, expr: Variable) -> Any:
@@ -408,13 +610,13 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         """
         return self._lookup_variable(expr.name, expr)
 
-    def _lookup_variable(self, name: Token, expr: Expr) -> Any:
+    def _lookup_variable(self, name: Token, expr: Union[Variable, This]) -> Any:
         """
         Lookup the value of a variable.
 
         Args:
             name (Token): The token representing the variable's name.
-            expr (Expr): The expression where the variable is used.
+            expr (Union[Variable, This]): The expression where the variable is used.
 
         Returns:
             Any: The value of the variable.
@@ -422,9 +624,8 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         Raises:
             RuntimeError: If the variable is undefined.
         """
-        distance: int = self._locals.get(expr, -1)
-        if distance != -1:
-            return self._environment.get_at(distance, name.lexeme)
+        if expr.depth >= 0:
+            return self._environment.get_slot(expr.depth, expr.slot)
         else:
             return self.globals.get(name)
 
@@ -441,9 +642,8 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         """
         value: Any = self._evaluate(expr.value)
 
-        distance: int = self._locals.get(expr, -1)
-        if distance != -1:
-            self._environment.assign_at(distance, expr.name, value)
+        if expr.depth >= 0:
+            self._environment.set_slot(expr.depth, expr.slot, value)
         else:
             self.globals.assign(expr.name, value)
 
@@ -460,7 +660,7 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         Returns:
             Any: The result of the conditional expression.
         """
-        if self._is_truthy(self._evaluate(expr.condition)):
+        if self._evaluate(expr.condition):
             return self._evaluate(expr.then_branch)
         else:
             return self._evaluate(expr.else_branch)
@@ -478,11 +678,11 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         """
         left: Any = self._evaluate(expr.left)
 
-        if expr.operator.type == TokenType.OR:
-            if self._is_truthy(left):
+        if expr.operator.type is _OR:
+            if left:
                 return left
         else:
-            if not self._is_truthy(left):
+            if not left:
                 return left
 
         return self._evaluate(expr.right)
@@ -524,9 +724,10 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         Raises:
             RuntimeError: If the method is undefined in the superclass.
         """
-        distance: int = self._locals[expr]
-        superclass: LoxClass = self._environment.get_at(distance, "super")
-        obj: LoxInstance = self._environment.get_at(distance - 1, "this")
+        distance: int = expr.depth
+        superclass: LoxClass = self._environment.get_slot(distance, expr.slot)
+        # 'this' is the only variable of the environment bound inside 'super'.
+        obj: LoxInstance = self._environment.get_slot(distance - 1, 0)
         method: Optional[LoxFunction] = superclass.find_method(expr.method.lexeme)
         if method is None:
             raise RuntimeError(
@@ -565,15 +766,26 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
 
         arguments: List[Any] = [self._evaluate(argument) for argument in expr.arguments]
 
-        if not isinstance(callee, LoxCallable):
-            raise LoxRuntimeError(expr.paren, "Can only call functions and classes.")
+        # A callable's arity never changes, so it is checked once per global callee.
+        # Other callees are not kept, so that a call site never holds on to a closure.
+        if callee is expr.last_callee and callee is not None:
+            arity: int = expr.last_arity
+        else:
+            if not getattr(callee, "is_callable", False):
+                raise LoxRuntimeError(
+                    expr.paren, "Can only call functions and classes."
+                )
+            arity = callee.arity()
+            if type(expr.callee) is Variable and expr.callee.depth < 0:
+                expr.last_callee = callee
+                expr.last_arity = arity
 
-        function: LoxCallable = cast(LoxCallable, callee)
+        function: LoxCallable = callee
 
-        if len(arguments) != function.arity():
+        if len(arguments) != arity:
             raise LoxRuntimeError(
                 expr.paren,
-                f"Expected {function.arity()} arguments but got {len(arguments)}.",
+                f"Expected {arity} arguments but got {len(arguments)}.",
             )
 
         return function.call(self, arguments)
@@ -595,7 +807,7 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         obj: Any = self._evaluate(expr.object)
         if isinstance(obj, LoxInstance):
             result = obj.get(expr.name)
-            if isinstance(result, LoxFunction) and result.is_getter():
+            if type(result) is LoxFunction and result.is_getter():
                 return result.call(self, [])
             return result
 
@@ -634,17 +846,39 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         if stmt.initializer is not None:
             value = self._evaluate(stmt.initializer)
 
-        self._environment.define(stmt.name.lexeme, value)
+        if stmt.slot >= 0:
+            self._environment.values[stmt.slot] = value
+        else:
+            self._environment.define(stmt.name.lexeme, value)
 
     @override
-    def visit_block_stmt(self, stmt: Block) -> None:
+    def visit_block_stmt(self, stmt: Block) -> Optional[Signal]:
         """
         Visit a block statement.
 
+        Inside a loop, a block the resolver marked reusable, such as a loop body without
+        closures, runs in the environment it used in the previous iteration whenever that
+        environment still has the current one as its parent. Only one execution of a
+        block can be active per parent environment, and every variable is assigned by its
+        declaration before it is read, so the old values need not be cleared. The
+        environments are released when the loop ends.
+
         Args:
             stmt (Block): The block statement.
+
+        Returns:
+            Optional[Signal]: The signal that ended the block, if any.
         """
-        self._execute_block(stmt.statements, Environment(self._environment))
+        environments: Optional[Dict[Block, Environment]] = self._block_environments
+        if environments is None or not stmt.reusable:
+            return self._execute_block(
+                stmt.statements, Environment(self._environment, stmt.slot_of)
+            )
+        environment: Optional[Environment] = environments.get(stmt)
+        if environment is None or environment.enclosing is not self._environment:
+            environment = Environment(self._environment, stmt.slot_of)
+            environments[stmt] = environment
+        return self._execute_block(stmt.statements, environment)
 
     @override
     def visit_class_stmt(self, stmt: Class) -> None:
@@ -679,7 +913,7 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
             None, f"{stmt.name.lexeme} metaclass", superclass, class_methods
         )
 
-        methods: Dict[str, LoxFunction] = self._apply_trait(stmt.traits)
+        methods: Dict[str, LoxFunction] = self._apply_trait(stmt)
 
         methods.update(
             {
@@ -699,41 +933,58 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         self._environment.assign(stmt.name, klass)
 
     @override
-    def visit_if_stmt(self, stmt: If) -> None:
+    def visit_if_stmt(self, stmt: If) -> Optional[Signal]:
         """
         Visit an if statement.
 
         Args:
             stmt (If): The if statement.
+
+        Returns:
+            Optional[Signal]: The signal raised by the executed branch, if any.
         """
-        if self._is_truthy(self._evaluate(stmt.condition)):
-            self._execute(stmt.then_branch)
-        elif stmt.else_branch is not None:
-            self._execute(stmt.else_branch)
+        if self._evaluate(stmt.condition):
+            return self._execute(stmt.then_branch)
+        if stmt.else_branch is not None:
+            return self._execute(stmt.else_branch)
+        return None
 
     @override
-    def visit_while_stmt(self, stmt: While) -> None:
+    def visit_while_stmt(self, stmt: While) -> Optional[Signal]:
         """
         Visit a while statement.
 
         Args:
             stmt (While): The while statement.
+
+        Returns:
+            Optional[Signal]: A return signal from the body, if any; breaks end the loop.
         """
-        while self._is_truthy(self._evaluate(stmt.condition)):
-            try:
-                self._execute(stmt.body)
-            except BreakException:
-                break
+        outer: Optional[Dict[Block, Environment]] = self._block_environments
+        self._block_environments = {}
+        try:
+            while self._evaluate(stmt.condition):
+                signal = self._execute(stmt.body)
+                if signal is not None:
+                    if signal[0] == BREAK:
+                        break
+                    return signal
+            return None
+        finally:
+            self._block_environments = outer
 
     @override
-    def visit_break_stmt(self, stmt: Break) -> None:
+    def visit_break_stmt(self, stmt: Break) -> Signal:
         """
         Visit a break statement.
 
         Args:
             stmt (Break): The break statement.
+
+        Returns:
+            Signal: The break signal, consumed by the enclosing loop.
         """
-        raise BreakException()
+        return _BREAK_SIGNAL
 
     @override
     def visit_function_stmt(self, stmt: Function) -> None:
@@ -747,21 +998,21 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         self._environment.define(stmt.name.lexeme, function)
 
     @override
-    def visit_return_stmt(self, stmt: Return) -> None:
+    def visit_return_stmt(self, stmt: Return) -> Signal:
         """
         Visit a return statement.
 
         Args:
             stmt (Return): The return statement.
 
-        Raises:
-            ReturnException: To unwind the call stack with the return value.
+        Returns:
+            Signal: The return signal carrying the value, consumed by the function call.
         """
         value: Any = None
         if stmt.value is not None:
             value = self._evaluate(stmt.value)
 
-        raise ReturnException(value)
+        return (RETURN, value)
 
     @override
     def visit_trait_stmt(self, stmt: Trait) -> None:
@@ -776,7 +1027,7 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         """
         self._environment.define(stmt.name.lexeme, None)
 
-        methods: Dict[str, LoxFunction] = self._apply_trait(stmt.traits)
+        methods: Dict[str, LoxFunction] = self._apply_trait(stmt)
 
         for method in stmt.methods:
             if method.name.lexeme in methods:
@@ -790,3 +1041,38 @@ class Interpreter(ExprVisitor[Any], StmtVisitor[None]):
         trait: LoxTrait = LoxTrait(stmt.name, methods)
 
         self._environment.assign(stmt.name, trait)
+
+
+# The operation for each binary operator. visit_binary_expr caches the entry on the
+# Binary node the first time it is evaluated, so later evaluations skip the lookup.
+_BINARY_OPERATIONS: Final[Dict[TokenType, BinaryOperation]] = {
+    TokenType.PLUS: Interpreter._add,
+    TokenType.MINUS: Interpreter._subtract,
+    TokenType.STAR: Interpreter._multiply,
+    TokenType.SLASH: Interpreter._divide,
+    TokenType.MODULO: Interpreter._modulo,
+    TokenType.GREATER: Interpreter._greater,
+    TokenType.GREATER_EQUAL: Interpreter._greater_equal,
+    TokenType.LESS: Interpreter._less,
+    TokenType.LESS_EQUAL: Interpreter._less_equal,
+    TokenType.EQUAL_EQUAL: Interpreter._equal,
+    TokenType.BANG_EQUAL: Interpreter._not_equal,
+}
+
+# The visit method for each expression node type, used by _evaluate in place of
+# the accept() double dispatch.
+_EXPR_VISITS: Final[Dict[type, Callable[[Interpreter, Any], Any]]] = {
+    Assign: Interpreter.visit_assign_expr,
+    Binary: Interpreter.visit_binary_expr,
+    Call: Interpreter.visit_call_expr,
+    Conditional: Interpreter.visit_conditional_expr,
+    Get: Interpreter.visit_get_expr,
+    Grouping: Interpreter.visit_grouping_expr,
+    Literal: Interpreter.visit_literal_expr,
+    Logical: Interpreter.visit_logical_expr,
+    Set: Interpreter.visit_set_expr,
+    Super: Interpreter.visit_super_expr,
+    This: Interpreter.visit_this_expr,
+    Unary: Interpreter.visit_unary_expr,
+    Variable: Interpreter.visit_variable_expr,
+}
@@ -2,8 +2,8 @@ import sys
 from pathlib import Path
 from typing import List
 
-from .ast_printer import AstPrinter
 from .error_handler import ErrorHandler
+from .fold import ConstantFolder
 from .interpreter import Interpreter
 from .parser import Parser
 from .resolver import Resolver
@@ -164,7 +164,7 @@ def run(
 ) -> None:
     """
     Processes the source code by scanning, parsing, optionally printing the AST,
-    and interpreting the statements.
+    resolving, folding constant expressions, and interpreting the statements.
 
     Args:
         source (str): The Lox source code.
@@ -182,10 +182,12 @@ def run(
         return
 
     if ast_enabled:
+        # Imported here so that runs without -ast skip loading the printer.
+        from .ast_printer import AstPrinter
+
         printer: AstPrinter = AstPrinter()
-        for i, statement in enumerate(statements):
-            printer.create_ast(statement)
-            printer.visualize_ast(i)
+        printer.visualize_many(statements)
+        printer.prune_stale_images()
 
     resolver: Resolver = Resolver(interpreter, error_handler)
     resolver.resolve(statements)
@@ -194,6 +196,10 @@ def run(
         error_handler.print_all_errors()
         return
 
+    # Folding can prune a branch, so it runs only once the resolver has checked
+    # every branch; the resolved depths and slots stay on the surviving nodes.
+    ConstantFolder(interpreter).fold(statements)
+
     interpreter.interpret(statements)
 
 
@@ -6,6 +6,7 @@ from .callable import LoxCallable
 from .error_handler import LoxRuntimeError
 from .lox_class import LoxClass
 from .lox_instance import LoxInstance
+from .stringify import format_number
 from .tokens import Token, TokenType
 
 if TYPE_CHECKING:
@@ -54,16 +55,18 @@ class ArrayGetCallable(LoxCallable):
             Any: The element at the specified index.
 
         Raises:
-            LoxRuntimeError: If the index is out of bounds.
-        """
-        try:
-            index: int = int(float(arguments[0]))
-            return self.elements[index]
-        except (IndexError, TypeError, ValueError):
-            raise LoxRuntimeError(
-                Token(TokenType.IDENTIFIER, "get", None, 0),
-                "Index out of bounds or invalid index type.",
-            )
+            LoxRuntimeError: If the index is not a number or is out of bounds.
+        """
+        index: Any = arguments[0]
+        if type(index) is float:
+            try:
+                return self.elements[int(index)]
+            except (IndexError, OverflowError, ValueError):
+                pass
+        raise LoxRuntimeError(
+            Token(TokenType.IDENTIFIER, "get", None, 0),
+            "Index out of bounds or invalid index type.",
+        )
 
     @override
     def __str__(self) -> str:
@@ -118,18 +121,20 @@ class ArraySetCallable(LoxCallable):
             Any: The value that was set.
 
         Raises:
-            LoxRuntimeError: If the index is out of bounds.
+            LoxRuntimeError: If the index is not a number or is out of bounds.
         """
-        try:
-            index: int = int(float(arguments[0]))
+        index: Any = arguments[0]
+        if type(index) is float:
             value: Any = arguments[1]
-            self.elements[index] = value
-            return value
-        except (IndexError, TypeError, ValueError):
-            raise LoxRuntimeError(
-                Token(TokenType.IDENTIFIER, "set", None, 0),
-                "Index out of bounds or invalid index type.",
-            )
+            try:
+                self.elements[int(index)] = value
+                return value
+            except (IndexError, OverflowError, ValueError):
+                pass
+        raise LoxRuntimeError(
+            Token(TokenType.IDENTIFIER, "set", None, 0),
+            "Index out of bounds or invalid index type.",
+        )
 
     @override
     def __str__(self) -> str:
@@ -146,11 +151,14 @@ class LoxArray(LoxInstance):
     """
     Represents an array instance in the Lox language.
 
+    The `get` and `set` callables are created on first access and reused afterwards,
+    so that a loop calling `array.get(i)` does not allocate a callable per iteration.
+
     Attributes:
         elements (List[Any]): The list of elements contained in the array.
     """
 
-    __slots__ = ("elements",)
+    __slots__ = ("elements", "_getter", "_setter")
 
     def __init__(self, size: int) -> None:
         """
@@ -162,6 +170,8 @@ class LoxArray(LoxInstance):
         array_class: LoxClass = LoxClass(None, "Array", None, {})
         super().__init__(array_class)
         self.elements: List[Any] = [None] * size
+        self._getter: Optional[ArrayGetCallable] = None
+        self._setter: Optional[ArraySetCallable] = None
 
     @override
     def get(self, name: Token) -> Any:
@@ -178,9 +188,15 @@ class LoxArray(LoxInstance):
             LoxRuntimeError: If the property is undefined.
         """
         if name.lexeme == "get":
-            return ArrayGetCallable(self.elements)
+            getter = self._getter
+            if getter is None or getter.elements is not self.elements:
+                getter = self._getter = ArrayGetCallable(self.elements)
+            return getter
         elif name.lexeme == "set":
-            return ArraySetCallable(self.elements)
+            setter = self._setter
+            if setter is None or setter.elements is not self.elements:
+                setter = self._setter = ArraySetCallable(self.elements)
+            return setter
         elif name.lexeme == "length":
             return float(len(self.elements))
 
@@ -222,6 +238,6 @@ class LoxArray(LoxInstance):
         """
         if obj is None:
             return "nil"
-        if isinstance(obj, float):
-            return str(int(obj)) if obj.is_integer() else str(obj)
+        if type(obj) is float:
+            return format_number(obj)
         return str(obj)
@@ -18,13 +18,17 @@ class LoxClass(LoxCallable, LoxInstance):
     and method lookup. It allows instances to be created and methods to be called
     within the context of the Lox interpreter.
 
+    A class and its superclasses never change after they are created, so the methods
+    inherited from the superclass chain are merged into one table up front, and a
+    method lookup is a single dictionary access however deep the hierarchy is.
+
     Attributes:
         name (str): The name of the class.
         superclass (Optional[LoxClass]): The superclass, if any.
         methods (Dict[str, LoxFunction]): The methods defined in the class.
     """
 
-    __slots__ = ("name", "superclass", "methods")
+    __slots__ = ("name", "superclass", "methods", "_all_methods")
 
     def __init__(
         self,
@@ -37,6 +41,9 @@ class LoxClass(LoxCallable, LoxInstance):
         self.name: str = name
         self.superclass: Optional[LoxClass] = superclass
         self.methods: Dict[str, LoxFunction] = methods
+        self._all_methods: Dict[str, LoxFunction] = (
+            methods if superclass is None else {**superclass._all_methods, **methods}
+        )
 
     def find_method(self, name: str) -> Optional[LoxFunction]:
         """
@@ -48,11 +55,7 @@ class LoxClass(LoxCallable, LoxInstance):
         Returns:
             Optional[LoxFunction]: The found method or None if not found.
         """
-        if name in self.methods:
-            return self.methods.get(name)
-        if self.superclass:
-            return self.superclass.find_method(name)
-        return None
+        return self._all_methods.get(name)
 
     def __str__(self) -> str:
         """
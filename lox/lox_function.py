@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, override
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, override
 
 from .callable import LoxCallable
 from .environment import Environment
-from .error_handler import ReturnException
 from .stmt import Function
 
 if TYPE_CHECKING:
     from .interpreter import Interpreter
     from .lox_instance import LoxInstance
 
+# Slots of a bound method's closure, which only holds 'this'.
+_THIS_SLOTS: Dict[str, int] = {"this": 0}
+
 
 class LoxFunction(LoxCallable):
     """
@@ -46,7 +48,7 @@ class LoxFunction(LoxCallable):
         Returns:
             LoxFunction: A new function bound to the given instance.
         """
-        environment: Environment = Environment(self.closure)
+        environment: Environment = Environment(self.closure, _THIS_SLOTS)
         environment.define("this", instance)
         return LoxFunction(self.declaration, environment, self.is_initializer)
 
@@ -71,18 +73,26 @@ class LoxFunction(LoxCallable):
         Returns:
             Any: The result of the function execution.
         """
-        environment: Environment = Environment(self.closure)
-        if self.declaration.params:
-            for param, arg in zip(self.declaration.params, arguments):
-                environment.define(param.lexeme, arg)
-
-        try:
-            interpreter._execute_block(self.declaration.body, environment)
-        except ReturnException as e:
-            return e.value
+        slot_of = self.declaration.slot_of
+        environment: Environment
+        if slot_of is not None:
+            # Parameters take the first slots of the resolved layout.
+            environment = Environment(self.closure, slot_of)
+            environment.values[: len(arguments)] = arguments
+        else:
+            environment = Environment(self.closure)
+            if self.declaration.params:
+                for param, arg in zip(self.declaration.params, arguments):
+                    environment.define(param.lexeme, arg)
+
+        signal = interpreter._execute_block(self.declaration.body, environment)
+        if signal is not None:
+            # A return signal carries the returned value.
+            return signal[1]
 
         if self.is_initializer:
-            return self.closure.get_at(0, "this")
+            # 'this' is the only variable in a bound method's closure.
+            return self.closure.values[0]
 
         return None
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 
 from .error_handler import ErrorHandler, ParseError
 from .expr import (
@@ -18,6 +18,7 @@ from .expr import (
     This,
     Unary,
     Variable,
+    make_literal,
 )
 from .stmt import (
     Block,
@@ -46,9 +47,11 @@ class Parser:
         tokens (List[Token]): The list of tokens to parse.
         current (int): The current position in the tokens list.
         error_handler (ErrorHandler): Handles parsing errors.
+        literals (Dict[Tuple[type, Any], Literal]): The shared Literal nodes of the parse,
+            see `make_literal`.
     """
 
-    __slots__ = ("tokens", "current", "error_handler")
+    __slots__ = ("tokens", "current", "error_handler", "literals")
 
     def __init__(
         self, tokens: List[Token], error_handler: Optional[ErrorHandler] = None
@@ -58,6 +61,7 @@ class Parser:
         self.error_handler: ErrorHandler = (
             error_handler if error_handler else ErrorHandler()
         )
+        self.literals: Dict[Tuple[type, Any], Literal] = {}
 
     def parse(self) -> List[Stmt]:
         """
@@ -178,7 +182,9 @@ class Parser:
                 )
             initializer = initializer_expr
         self._consume(TokenType.SEMICOLON, "Expect ';' after variable declaration.")
-        return Var(name, initializer if initializer is not None else Literal(None))
+        if initializer is None:
+            initializer = make_literal(None, self.literals)
+        return Var(name, initializer)
 
     def _statement(self) -> Stmt:
         """
@@ -283,7 +289,7 @@ class Parser:
             body = Block([body, Expression(increment)])
 
         if condition is None:
-            condition = Literal(True)
+            condition = make_literal(True, self.literals)
         body = While(condition, body)
 
         if initializer is not None:
@@ -427,7 +433,7 @@ class Parser:
                 get: Get = expr
                 return Set(get.object, get.name, value)
 
-            self.error_handler.parse_error(equals, "Invalid assignment target.")
+            self.error_handler.report_parse_error(equals, "Invalid assignment target.")
 
         return expr
 
@@ -584,7 +590,7 @@ class Parser:
             arguments.append(self._expression())
             while self._match(TokenType.COMMA):
                 if len(arguments) >= 255:
-                    self.error_handler.parse_error(
+                    self.error_handler.report_parse_error(
                         self._peek(), "Cannot have more than 255 arguments."
                     )
                 arguments.append(self._expression())
@@ -605,14 +611,14 @@ class Parser:
             ParseError: If an unexpected token is encountered.
         """
         if self._match(TokenType.FALSE):
-            return Literal(False)
+            return make_literal(False, self.literals)
         elif self._match(TokenType.TRUE):
-            return Literal(True)
+            return make_literal(True, self.literals)
         elif self._match(TokenType.NIL):
-            return Literal(None)
+            return make_literal(None, self.literals)
 
         if self._match(TokenType.NUMBER, TokenType.STRING):
-            return Literal(self._previous().literal)
+            return make_literal(self._previous().literal, self.literals)
 
         if self._match(TokenType.SUPER):
             keyword: Token = self._previous()
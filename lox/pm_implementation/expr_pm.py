@@ -3,10 +3,10 @@ from typing import Any
 
 
 class Expr:
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Binary(Expr):
     __match_args__ = ("left", "operator", "right")
     left: Expr
@@ -14,20 +14,20 @@ class Binary(Expr):
     right: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Unary(Expr):
     __match_args__ = ("operator", "right")
     operator: str
     right: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Literal(Expr):
     __match_args__ = ("value",)
     value: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Grouping(Expr):
     __match_args__ = ("expression",)
     expression: Expr
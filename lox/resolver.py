@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from enum import Enum
 from functools import singledispatchmethod
-from typing import Dict, Generic, List, Optional, TypeVar, override
+from typing import Dict, Generic, List, Optional, TypeVar, Union, override
 
 from .error_handler import ErrorHandler, ParseError
 from .expr import (
@@ -160,6 +160,7 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
         error_handler (ErrorHandler): Handles and reports parsing errors.
         current_function (FunctionType): The current function context.
         current_class (ClassType): The current class context.
+        _functions_resolved (int): The number of functions and methods resolved so far.
     """
 
     __slots__ = (
@@ -168,6 +169,7 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
         "error_handler",
         "current_function",
         "current_class",
+        "_functions_resolved",
     )
 
     def __init__(self, interpreter: Interpreter, error_handler: ErrorHandler) -> None:
@@ -176,6 +178,7 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
         self.error_handler: ErrorHandler = error_handler
         self.current_function: FunctionType = FunctionType.NONE
         self.current_class: ClassType = ClassType.NONE
+        self._functions_resolved: int = 0
 
     # Statement Visitors
 
@@ -184,12 +187,20 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
         """
         Visits a block statement, introducing a new scope.
 
+        Records the slots of the block's scope on the statement, so that the interpreter
+        can lay out the block's environment in one step. A block that declares no function,
+        class or trait, at any depth, is marked reusable: nothing can capture its
+        environment, so the interpreter may run it again in the same one.
+
         Args:
             stmt (Block): The block statement to visit.
         """
+        functions_resolved: int = self._functions_resolved
         self._begin_scope()
         self.resolve(stmt.statements)
+        stmt.slot_of = {name: slot for slot, name in enumerate(self._scopes.peek())}
         self._end_scope()
+        stmt.reusable = self._functions_resolved == functions_resolved
         return None
 
     @override
@@ -219,6 +230,14 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
             self._begin_scope()
             self._scopes.peek()["super"] = True
 
+        # Class methods are bound to the class itself, so their 'this' scope
+        # sits directly inside the superclass scope, as at runtime.
+        for method in stmt.class_methods:
+            self._begin_scope()
+            self._scopes.peek()["this"] = True
+            self._resolve_function(method, FunctionType.METHOD)
+            self._end_scope()
+
         self._begin_scope()
         self._scopes.peek()["this"] = True
 
@@ -228,12 +247,6 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
                 declaration = FunctionType.INITIALIZER
             self._resolve_function(method, declaration)
 
-        for method in stmt.class_methods:
-            self._begin_scope()
-            self._scopes.peek()["this"] = True
-            self._resolve_function(method, FunctionType.METHOD)
-            self._end_scope()
-
         self._end_scope()
 
         if stmt.superclass:
@@ -326,10 +339,14 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
         """
         Visits a variable declaration, declaring it before resolving its initializer.
 
+        Local variables get the slot they occupy in their scope recorded on the statement.
+
         Args:
             stmt (Var): The variable statement to visit.
         """
         self._declare(stmt.name)
+        if not self._scopes.is_empty():
+            stmt.slot = list(self._scopes.peek()).index(stmt.name.lexeme)
         if stmt.initializer:
             self.resolve(stmt.initializer)
         self._define(stmt.name)
@@ -632,17 +649,24 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
         scope: Dict[str, bool] = self._scopes.peek()
         scope[name.lexeme] = True
 
-    def _resolve_local(self, expr: Expr, name: Token) -> None:
+    def _resolve_local(
+        self, expr: Union[Variable, Assign, This, Super], name: Token
+    ) -> None:
         """
-        Resolves the scope of a variable and communicates its depth to the interpreter.
+        Resolves the scope of a variable and communicates its depth and slot to the interpreter.
+
+        Variables occupy slots in the order they are declared in a scope, matching the order
+        in which the interpreter defines them in the corresponding environment.
 
         Args:
-            expr (Expr): The expression containing the variable.
+            expr (Union[Variable, Assign, This, Super]): The expression containing the variable.
             name (Token): The name token of the variable.
         """
         for i in range(len(self._scopes) - 1, -1, -1):
-            if name.lexeme in self._scopes._items[i]:
-                self._interpreter.resolve(expr, len(self._scopes) - 1 - i)
+            scope: Dict[str, bool] = self._scopes._items[i]
+            if name.lexeme in scope:
+                slot: int = list(scope).index(name.lexeme)
+                self._interpreter.resolve(expr, len(self._scopes) - 1 - i, slot)
                 return None
         # Not found. Assume global.
         return None
@@ -651,10 +675,14 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
         """
         Resolves a function's scope and parameters.
 
+        Records the slots of the function's scope on the declaration, so that
+        calls can lay out their environment without defining names one by one.
+
         Args:
             function (Function): The function to resolve.
             type (FunctionType): The type of the function being resolved.
         """
+        self._functions_resolved += 1
         enclosing_function: FunctionType = self.current_function
         self.current_function = type
         self._begin_scope()
@@ -663,6 +691,7 @@ class Resolver(ExprVisitor[None], StmtVisitor[None]):
                 self._declare(param)
                 self._define(param)
         self.resolve(function.body)
+        function.slot_of = {name: slot for slot, name in enumerate(self._scopes.peek())}
         self._end_scope()
         self.current_function = enclosing_function
         return None
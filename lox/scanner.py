@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import List, Optional
 
 from .error_handler import ErrorHandler
@@ -170,9 +171,13 @@ class Scanner:
         """
         while self._peek().isalnum():
             self._advance()
-        text: str = self.source[self.start : self.current]
+        # Interned so that every occurrence of a name shares one string object,
+        # letting environment lookups succeed on the identity check.
+        text: str = sys.intern(self.source[self.start : self.current])
         token_type: TokenType = KEYWORDS.get(text, TokenType.IDENTIFIER)
-        self.add_token(token_type)
+        self.tokens.append(
+            Token(type=token_type, lexeme=text, literal=None, line=self.line)
+        )
 
     def block_comment(self) -> None:
         """
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar, override
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, override
 
 from .expr import Expr, Variable
 from .tokens import Token
@@ -9,12 +8,14 @@ from .tokens import Token
 T = TypeVar("T")
 
 
-class StmtVisitor(ABC, Generic[T]):
+class StmtVisitor(Generic[T]):
     """
-    Abstract base class for visiting different types of statements.
+    Base class for visiting different types of statements.
 
     This visitor pattern allows operations to be performed on various
-    statement types without modifying their classes.
+    statement types without modifying their classes. Like ExprVisitor it is a
+    plain base class rather than an ABC; visit methods that a visitor does not
+    override raise NotImplementedError.
 
     Methods:
         visit_expression_stmt (Expression) -> T: Visit an expression statement.
@@ -30,49 +31,53 @@ class StmtVisitor(ABC, Generic[T]):
         visit_trait_stmt (Trait) -> T: Visit a trait declaration statement.
     """
 
-    @abstractmethod
-    def visit_expression_stmt(self, stmt: Expression) -> T: ...
+    def visit_expression_stmt(self, stmt: Expression) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_print_stmt(self, stmt: Print) -> T: ...
+    def visit_print_stmt(self, stmt: Print) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_var_stmt(self, stmt: Var) -> T: ...
+    def visit_var_stmt(self, stmt: Var) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_block_stmt(self, stmt: Block) -> T: ...
+    def visit_block_stmt(self, stmt: Block) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_if_stmt(self, stmt: If) -> T: ...
+    def visit_if_stmt(self, stmt: If) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_while_stmt(self, stmt: While) -> T: ...
+    def visit_while_stmt(self, stmt: While) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_break_stmt(self, stmt: Break) -> T: ...
+    def visit_break_stmt(self, stmt: Break) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_function_stmt(self, stmt: Function) -> T: ...
+    def visit_function_stmt(self, stmt: Function) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_return_stmt(self, stmt: Return) -> T: ...
+    def visit_return_stmt(self, stmt: Return) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_class_stmt(self, stmt: Class) -> T: ...
+    def visit_class_stmt(self, stmt: Class) -> T:
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_trait_stmt(self, stmt: Trait) -> T: ...
+    def visit_trait_stmt(self, stmt: Trait) -> T:
+        raise NotImplementedError
 
 
-class Stmt(ABC):
+class Stmt:
     """
-    Abstract base class for all statement types.
+    Base class for all statement types.
 
     Each statement must implement the accept method to allow visitor operations.
+    Stmt declares empty `__slots__` so that the slotted subclasses carry no
+    `__dict__`.
     """
 
-    @abstractmethod
-    def accept(self, visitor: StmtVisitor[T]) -> T: ...
+    __slots__ = ()
+
+    def accept(self, visitor: StmtVisitor[T]) -> T:
+        raise NotImplementedError
 
 
 class Expression(Stmt):
@@ -118,13 +123,16 @@ class Var(Stmt):
     Attributes:
         name (Token): The name of the variable.
         initializer (Expr): The initializer expression for the variable.
+        slot (int): The slot of the variable in its scope's environment, set by the
+            resolver, or -1 if it is a global.
     """
 
-    __slots__ = ("name", "initializer")
+    __slots__ = ("name", "initializer", "slot")
 
     def __init__(self, name: Token, initializer: Expr) -> None:
         self.name: Token = name
         self.initializer: Expr = initializer
+        self.slot: int = -1
 
     @override
     def accept(self, visitor: StmtVisitor[T]) -> T:
@@ -137,12 +145,18 @@ class Block(Stmt):
 
     Attributes:
         statements (List[Stmt]): The list of statements within the block.
+        slot_of (Optional[Dict[str, int]]): The slots of the variables declared in the
+            block in its environment, filled in by the resolver.
+        reusable (bool): Whether the block's environment can be reused across executions,
+            set by the resolver when nothing in the block can capture it.
     """
 
-    __slots__ = ("statements",)
+    __slots__ = ("statements", "slot_of", "reusable")
 
     def __init__(self, statements: List[Stmt]) -> None:
         self.statements: List[Stmt] = statements
+        self.slot_of: Optional[Dict[str, int]] = None
+        self.reusable: bool = False
 
     @override
     def accept(self, visitor: StmtVisitor[T]) -> T:
@@ -159,9 +173,18 @@ class Class(Stmt):
         methods (List[Function]): The list of instance methods.
         class_methods (List[Function]): The list of class methods.
         traits (List[Expr]): The list of traits used by the class.
+        applied_traits (Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]]): The trait objects
+            the interpreter last evaluated for this class and their merged methods.
     """
 
-    __slots__ = ("name", "superclass", "methods", "class_methods", "traits")
+    __slots__ = (
+        "name",
+        "superclass",
+        "methods",
+        "class_methods",
+        "traits",
+        "applied_traits",
+    )
 
     def __init__(
         self,
@@ -176,6 +199,7 @@ class Class(Stmt):
         self.methods: List[Function] = methods
         self.class_methods: List[Function] = class_methods
         self.traits: List[Expr] = traits
+        self.applied_traits: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
 
     @override
     def accept(self, visitor: StmtVisitor[T]) -> T:
@@ -190,9 +214,11 @@ class Function(Stmt):
         name (Token): The name of the function.
         params (Optional[List[Token]]): The list of parameters for the function.
         body (List[Stmt]): The list of statements constituting the function body.
+        slot_of (Optional[Dict[str, int]]): The slots of the parameters and body-level
+            variables in a call's environment, filled in by the resolver.
     """
 
-    __slots__ = ("name", "params", "body")
+    __slots__ = ("name", "params", "body", "slot_of")
 
     def __init__(
         self, name: Token, params: Optional[List[Token]], body: List[Stmt]
@@ -200,6 +226,7 @@ class Function(Stmt):
         self.name: Token = name
         self.params: Optional[List[Token]] = params
         self.body: List[Stmt] = body
+        self.slot_of: Optional[Dict[str, int]] = None
 
     @override
     def accept(self, visitor: StmtVisitor[T]) -> T:
@@ -292,9 +319,11 @@ class Trait(Stmt):
         name (Token): The name of the trait.
         traits (List[Expr]): The list of traits this trait uses.
         methods (List[Function]): The list of methods defined in the trait.
+        applied_traits (Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]]): The trait objects
+            the interpreter last evaluated for this trait and their merged methods.
     """
 
-    __slots__ = ("name", "traits", "methods")
+    __slots__ = ("name", "traits", "methods", "applied_traits")
 
     def __init__(
         self, name: Token, traits: List[Expr], methods: List[Function]
@@ -302,6 +331,7 @@ class Trait(Stmt):
         self.name: Token = name
         self.traits: List[Expr] = traits
         self.methods: List[Function] = methods
+        self.applied_traits: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
 
     @override
     def accept(self, visitor: StmtVisitor[T]) -> T:
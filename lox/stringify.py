@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _format_integral(value: float) -> str:
+    """
+    Format an integer-valued float without a fractional part.
+
+    Programs tend to print the same loop counters and indices over and over, so the
+    strings are cached.
+
+    Args:
+        value (float): The float to format; must be integer-valued.
+
+    Returns:
+        str: The integer digits of the value.
+    """
+    return str(int(value))
+
+
+def format_number(value: float) -> str:
+    """
+    Format a Lox number the way Lox prints it.
+
+    Integer-valued numbers are printed without a fractional part, so `3.0` prints as
+    `3`; other numbers use Python's float representation.
+
+    Args:
+        value (float): The number to format.
+
+    Returns:
+        str: The printed form of the number.
+    """
+    return _format_integral(value) if value.is_integer() else str(value)
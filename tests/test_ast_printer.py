@@ -1,10 +1,11 @@
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from lox.ast_printer import AstPrinter
+from lox.ast_printer import AstPrinter, PrintNode, render_dot, render_text
 from lox.expr import Binary, Literal, Variable
-from lox.stmt import Expression, Print, Var
+from lox.stmt import Expression, Function, Print, Return, Var
 from lox.tokens import Token, TokenType
 
 
@@ -14,47 +15,195 @@ class TestAstPrinter(unittest.TestCase):
         self.ast_printer._output_dir = Path("test_output")
         self.token = lambda type, lexeme: Token(type, lexeme, None, 1)
 
-    def test_split_expression(self):
-        expressions = [
-            ("(+ 1 2)", ["(+ 1 2)"]),
-            ('print "hello"', ["print", '"hello"']),
-            ("(group (+ 1 2))", ["(group (+ 1 2))"]),
-            ('(print "hello" "world")', ['(print "hello" "world")']),
-        ]
-
-        for expr, expected in expressions:
-            with self.subTest(expr=expr):
-                result = self.ast_printer._split_expression(expr)
-                self.assertEqual(result, expected)
-
-    def test_parse_literal_expr(self):
-        with patch("pygraphviz.AGraph") as MockAGraph:
-            mock_graph = MockAGraph()
-            self.ast_printer._parse_literal_expr("42", mock_graph)
-            mock_graph.add_node.assert_called_once()
-            args = mock_graph.add_node.call_args[0]
-            self.assertTrue(args[0].startswith("node"))
-            self.assertEqual(mock_graph.add_node.call_args[1]["label"], "Number: 42")
+    def test_render_dot_literal(self):
+        out = []
+        self.ast_printer.create_ast(Expression(Literal(42)))
+        self.assertEqual(render_dot(self.ast_printer.ir, out), "node1")
+        self.assertEqual(
+            out,
+            [
+                'node1 [label="expr"];',
+                'node2 [label="Number: 42"];',
+                "node1 -> node2;",
+            ],
+        )
+
+    def test_render_dot_nested(self):
+        inner = Binary(Literal(2), self.token(TokenType.STAR, "*"), Literal(3))
+        outer = Binary(Literal(1), self.token(TokenType.PLUS, "+"), inner)
+        out = []
+        self.ast_printer.create_ast(Print(outer))
+        render_dot(self.ast_printer.ir, out)
+        labels = [line for line in out if "[label=" in line]
+        self.assertEqual(len(labels), 6)
+        self.assertIn("node2 -> node4;", out)
+        self.assertIn("node4 -> node6;", out)
+
+    def test_render_dot_numbers_large_graphs(self):
+        node = PrintNode("block", "block", [PrintNode("number", "1")] * 1500)
+        for _ in range(2):
+            out = []
+            render_dot(node, out)
+            self.assertEqual(
+                out[-2:], ['node1501 [label="Number: 1"];', "node1 -> node1501;"]
+            )
+
+    def test_render_dot_escapes_quotes(self):
+        out = []
+        render_dot(PrintNode("string", "hi"), out)
+        self.assertEqual(out, ['node1 [label="String: \\"hi\\""];'])
+
+    def test_render_dot_escapes_backslashes(self):
+        out = []
+        render_dot(PrintNode("string", "a\\"), out)
+        self.assertEqual(out, ['node1 [label="String: \\"a\\\\\\""];'])
+
+    def test_function_name_is_child_node(self):
+        name = self.token(TokenType.IDENTIFIER, "f")
+        keyword = self.token(TokenType.RETURN, "return")
+        self.ast_printer.create_ast(Function(name, [], [Return(keyword, Literal(1))]))
+        self.assertEqual(self.ast_printer.ast, "(fun f (return 1))")
+
+        out = []
+        render_dot(self.ast_printer.ir, out)
+        self.assertEqual(
+            out[:4],
+            [
+                'node1 [label="fun"];',
+                'node2 [label="f"];',
+                "node1 -> node2;",
+                'node3 [label="return"];',
+            ],
+        )
+
+    def test_ast_rendered_lazily(self):
+        self.ast_printer.create_ast(Print(Literal(42)))
+        self.assertIsNone(self.ast_printer._ast)
+        self.assertEqual(self.ast_printer.ast, "(print 42)")
+        self.assertEqual(self.ast_printer._ast, "(print 42)")
+
+    def test_print_node_ir(self):
+        self.ast_printer.create_ast(Print(Literal("hi")))
+        ir = self.ast_printer.ir
+        self.assertEqual(ir, PrintNode("print", "print", [PrintNode("string", "hi")]))
+        self.assertEqual(render_text(ir), '(print "hi")')
+
+    def test_literal_node_cached(self):
+        literal = Literal(42)
+        first = self.ast_printer.visit_literal_expr(literal)
+        self.assertEqual(first, PrintNode("number", "42"))
+        self.assertIs(literal.printed, first)
+        self.assertIs(self.ast_printer.visit_literal_expr(literal), first)
+
+    @patch("pygraphviz.AGraph")
+    def test_visualize_ast_skips_unchanged(self, mock_agraph):
+        graph = mock_agraph.return_value
+        graph.draw.side_effect = lambda path: Path(path).touch()
+        with tempfile.TemporaryDirectory() as tmp:
+            self.ast_printer._output_dir = Path(tmp)
+            (Path(tmp) / "ast_statement_9.png").touch()
+            (Path(tmp) / "notes.txt").touch()
+            self.ast_printer.create_ast(Print(Literal(42)))
+
+            with patch("builtins.print"):
+                self.ast_printer.visualize_ast(0)
+                self.ast_printer.visualize_ast(0)
+                self.assertEqual(graph.draw.call_count, 1)
+
+                self.ast_printer.create_ast(Print(Literal(43)))
+                self.ast_printer.visualize_ast(0)
+                self.assertEqual(graph.draw.call_count, 2)
+
+            self.ast_printer.prune_stale_images()
+            self.assertEqual(
+                sorted(p.name for p in Path(tmp).iterdir()),
+                ["ast_statement_0.hash", "ast_statement_0.png", "notes.txt"],
+            )
+
+    def test_prune_stale_images_matches_output_names(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.ast_printer._output_dir = Path(tmp) / "ast"
+            self.ast_printer.prune_stale_images()
+
+            self.ast_printer._output_dir.mkdir()
+            for name in ("all.pdf", "all.pdf.bak", "ast_statement_3.hash", "x.png"):
+                (self.ast_printer._output_dir / name).touch()
+            self.ast_printer.prune_stale_images()
+            self.assertEqual(
+                sorted(p.name for p in self.ast_printer._output_dir.iterdir()),
+                ["all.pdf.bak", "x.png"],
+            )
+
+    @patch("pygraphviz.AGraph")
+    def test_visualize_all_single_layout(self, mock_agraph):
+        graph = mock_agraph.return_value
+        with tempfile.TemporaryDirectory() as tmp:
+            self.ast_printer._output_dir = Path(tmp)
+            with patch("builtins.print"):
+                self.ast_printer.visualize_all([Print(Literal(1)), Print(Literal(2))])
+        mock_agraph.assert_called_once()
+        dot = mock_agraph.call_args[1]["string"]
+        self.assertIn("subgraph cluster_0 {", dot)
+        self.assertIn("subgraph cluster_1 {", dot)
+        self.assertIn("node3 -> node4;", dot)
+        graph.layout.assert_called_once_with(prog="dot")
+        graph.draw.assert_called_once_with(str(Path(tmp) / "all.pdf"))
+
+    @patch("lox.ast_printer.ProcessPoolExecutor")
+    @patch("lox.ast_printer._draw_dot")
+    def test_visualize_many_skips_up_to_date(self, mock_draw, mock_pool):
+        executor = mock_pool.return_value.__enter__.return_value
+        executor.map.side_effect = lambda fn, jobs: [Path(j[1]).touch() for j in jobs]
+        mock_draw.side_effect = lambda job: Path(job[1]).touch()
+        statements = [Print(Literal(1)), Print(Literal(2))]
+        with tempfile.TemporaryDirectory() as tmp:
+            self.ast_printer._output_dir = Path(tmp)
+            with patch("builtins.print"):
+                self.ast_printer.visualize_many(statements)
+                self.assertEqual(len(executor.map.call_args[0][1]), 2)
+
+                statements[1] = Print(Literal(3))
+                self.ast_printer.visualize_many(statements)
+            self.assertEqual(executor.map.call_count, 1)
+            mock_draw.assert_called_once()
+            self.assertTrue(
+                mock_draw.call_args[0][0][1].endswith("ast_statement_1.png")
+            )
+
+    def test_render_deeply_nested(self):
+        node = PrintNode("number", "1")
+        for _ in range(5000):
+            node = PrintNode("grouping", "group", [node])
+        text = render_text(node)
+        self.assertTrue(text.startswith("(group (group"))
+        self.assertEqual(text.count(")"), 5000)
+        out = []
+        self.assertEqual(render_dot(node, out), "node1")
+        self.assertEqual(len(out), 2 * 5001 - 1)
 
     def test_basic_expressions(self):
         expr = Binary(Literal(1), self.token(TokenType.PLUS, "+"), Literal(2))
-        result = expr.accept(self.ast_printer)
+        self.ast_printer.create_ast(expr)
+        result = self.ast_printer.ast
         self.assertEqual(result, "(+ 1 2)")
 
     def test_nested_expressions(self):
         inner = Binary(Literal(2), self.token(TokenType.STAR, "*"), Literal(3))
         outer = Binary(inner, self.token(TokenType.PLUS, "+"), Literal(1))
-        result = outer.accept(self.ast_printer)
+        self.ast_printer.create_ast(outer)
+        result = self.ast_printer.ast
         self.assertEqual(result, "(+ (* 2 3) 1)")
 
     def test_variable_declaration(self):
         var_stmt = Var(self.token(TokenType.IDENTIFIER, "x"), Literal(42))
-        result = var_stmt.accept(self.ast_printer)
+        self.ast_printer.create_ast(var_stmt)
+        result = self.ast_printer.ast
         self.assertEqual(result, "(var x 42)")
 
     def test_print_statement(self):
         print_stmt = Print(Literal("hello"))
-        result = print_stmt.accept(self.ast_printer)
+        self.ast_printer.create_ast(print_stmt)
+        result = self.ast_printer.ast
         self.assertEqual(result, '(print "hello")')
 
     def test_create_ast(self):
@@ -65,22 +214,16 @@ class TestAstPrinter(unittest.TestCase):
         self.ast_printer.create_ast(None)
         self.assertEqual(self.ast_printer.ast, "")
 
-    def test_expression_parsing(self):
-        expr = "(+ 1 (* 2 3))"
-        with patch("pygraphviz.AGraph") as MockAGraph:
-            mock_graph = MockAGraph()
-            self.ast_printer._parse_expression(expr, mock_graph)
-            # Verify nodes were added for operators and numbers
-            self.assertGreater(mock_graph.add_node.call_count, 3)
-
     def test_variable_expr(self):
         var = Variable(self.token(TokenType.IDENTIFIER, "foo"))
-        result = var.accept(self.ast_printer)
+        self.ast_printer.create_ast(var)
+        result = self.ast_printer.ast
         self.assertEqual(result, "foo")
 
     def test_expression_stmt(self):
         expr_stmt = Expression(Literal(42))
-        result = expr_stmt.accept(self.ast_printer)
+        self.ast_printer.create_ast(expr_stmt)
+        result = self.ast_printer.ast
         self.assertEqual(result, "(expr 42)")
 
 
@@ -28,6 +28,7 @@ class TestLoxCallable(unittest.TestCase):
 
         callable_obj = ConcreteCallable()
         self.assertEqual(callable_obj.call(None, []), "result")
+        self.assertTrue(callable_obj.is_callable)
         self.assertEqual(callable_obj.arity(), 0)
         self.assertEqual(str(callable_obj), "ConcreteCallable")
 
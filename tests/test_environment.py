@@ -69,6 +69,53 @@ class TestEnvironment(unittest.TestCase):
         self.inner_env.assign_at(2, token, "new_global")
         self.assertEqual(self.global_env.get(token), "new_global")
 
+    def test_slots_follow_definition_order(self):
+        self.local_env.define("a", 1)
+        self.local_env.define("b", 2)
+        self.local_env.define("a", 3)
+
+        self.assertEqual(self.local_env.values, [3, 2])
+        self.assertEqual(self.local_env.slot_of, {"a": 0, "b": 1})
+
+    def test_get_and_set_slot(self):
+        self.global_env.define("x", "global")
+        self.local_env.define("y", "local")
+
+        self.assertEqual(self.inner_env.get_slot(2, 0), "global")
+        self.assertEqual(self.inner_env.get_slot(1, 0), "local")
+
+        self.inner_env.set_slot(1, 0, "changed")
+        token = Token(TokenType.IDENTIFIER, "y", None, 1)
+        self.assertEqual(self.local_env.get(token), "changed")
+
+    def test_shared_slot_layout(self):
+        slot_of = {"a": 0, "b": 1}
+        env = Environment(self.global_env, slot_of)
+        self.assertEqual(env.values, [None, None])
+
+        env.define("b", 2)
+        self.assertEqual(env.values, [None, 2])
+        self.assertIs(env.slot_of, slot_of)
+        self.assertEqual(slot_of, {"a": 0, "b": 1})
+
+    def test_shared_slot_layout_copied_on_new_name(self):
+        slot_of = {"a": 0}
+        env = Environment(self.global_env, slot_of)
+        other = Environment(self.global_env, slot_of)
+
+        env.define("c", 3)
+        self.assertEqual(env.values, [None, 3])
+        self.assertEqual(env.slot_of, {"a": 0, "c": 1})
+        self.assertEqual(slot_of, {"a": 0})
+        self.assertIs(other.slot_of, slot_of)
+
+    def test_ancestors_cached(self):
+        self.assertEqual(
+            self.inner_env._ancestors,
+            (self.inner_env, self.local_env, self.global_env),
+        )
+        self.assertEqual(self.global_env._ancestors, (self.global_env,))
+
     def test_invalid_ancestor_distance(self):
         with self.assertRaises(AssertionError):
             self.inner_env._ancestor(4)
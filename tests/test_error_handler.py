@@ -1,13 +1,7 @@
 import unittest
 from unittest.mock import patch
 
-from lox.error_handler import (
-    BreakException,
-    ErrorHandler,
-    LoxRuntimeError,
-    ParseError,
-    ReturnException,
-)
+from lox.error_handler import ErrorHandler, LoxRuntimeError, ParseError
 from lox.tokens import Token, TokenType
 
 
@@ -31,6 +25,14 @@ class TestErrorHandler(unittest.TestCase):
             self.assertEqual(error.token, self.token)
             self.assertTrue(self.handler.had_error)
 
+    def test_report_parse_error(self):
+        with patch("builtins.print") as mock_print:
+            self.assertIsNone(
+                self.handler.report_parse_error(self.token, "Parse error")
+            )
+            self.assertTrue(self.handler.had_error)
+            mock_print.assert_called_once_with("[1] Error: Parse error")
+
     def test_print_all_errors(self):
         self.handler.error(1, "Error 1")
         self.handler.error(2, "Error 2")
@@ -69,14 +71,14 @@ class TestExceptions(unittest.TestCase):
         error = ParseError(token, "Parse error")
         self.assertEqual(str(error), "Parse error")
         self.assertEqual(error.token, token)
+        self.assertIsNone(error.error_handler)
 
-    def test_return_exception(self):
-        exception = ReturnException(42)
-        self.assertEqual(exception.value, 42)
-
-    def test_break_exception(self):
-        exception = BreakException()
-        self.assertIsInstance(exception, BreakException)
+    @patch("builtins.print")
+    def test_parse_error_keeps_handler(self, mock_print):
+        token = Token(TokenType.IDENTIFIER, "test", None, 1)
+        handler = ErrorHandler()
+        error = handler.parse_error(token, "Parse error")
+        self.assertIs(error.error_handler, handler)
 
 
 if __name__ == "__main__":
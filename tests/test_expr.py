@@ -17,6 +17,7 @@ from lox.expr import (
     This,
     Unary,
     Variable,
+    make_literal,
 )
 from lox.tokens import Token, TokenType
 
@@ -100,6 +101,50 @@ class TestExpressions(unittest.TestCase):
         expr.accept(self.visitor)
         self.visitor.visit_conditional_expr.assert_called_once_with(expr)
 
+    def test_nodes_have_no_dict(self):
+        expr = Binary(Literal(1.0), Token(TokenType.PLUS, "+", None, 1), Literal(2.0))
+        self.assertFalse(hasattr(expr, "__dict__"))
+        with self.assertRaises(AttributeError):
+            expr.extra = True
+
+    def test_unimplemented_visit_raises(self):
+        with self.assertRaises(NotImplementedError):
+            Literal(1.0).accept(ExprVisitor())
+
+    def test_make_literal_shares_nodes(self):
+        literals = {}
+        self.assertIs(make_literal(1.0, literals), make_literal(1.0, literals))
+        self.assertIs(make_literal(None, literals), make_literal(None, literals))
+        self.assertIsNot(make_literal(1.0, literals), make_literal(True, literals))
+        self.assertIs(make_literal(True, literals).value, True)
+        self.assertIsNot(make_literal(1.0, literals), make_literal(1.0, {}))
+
+        unhashable = make_literal([1.0], literals)
+        self.assertEqual(unhashable.value, [1.0])
+        self.assertIsNot(unhashable, make_literal([1.0], literals))
+
+    def test_call_arguments_are_tuple(self):
+        arguments = [Literal(1.0), Literal(2.0)]
+        expr = Call(
+            Literal("fn"), Token(TokenType.RIGHT_PAREN, ")", None, 1), arguments
+        )
+        self.assertIsInstance(expr.arguments, tuple)
+        arguments.append(Literal(3.0))
+        self.assertEqual(len(expr.arguments), 2)
+
+    def test_match_args(self):
+        plus = Token(TokenType.PLUS, "+", None, 1)
+        match Binary(
+            Literal(1.0), plus, Variable(Token(TokenType.IDENTIFIER, "x", None, 1))
+        ):
+            case Binary(Literal(value), operator, Variable(name)):
+                self.assertEqual(value, 1.0)
+                self.assertIs(operator, plus)
+                self.assertEqual(name.lexeme, "x")
+            case _:
+                self.fail("Binary did not match its positional pattern")
+        self.assertEqual(Literal.__match_args__, ("value",))
+
     def test_visitor_implementation(self):
         visitor = TestExprVisitor()
         exprs = {
@@ -0,0 +1,117 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from lox.error_handler import ErrorHandler
+from lox.expr import Binary, Call, Grouping, Literal, Logical, Variable
+from lox.fold import ConstantFolder
+from lox.interpreter import Interpreter
+from lox.lox import run
+from lox.parser import Parser
+from lox.resolver import Resolver
+from lox.scanner import Scanner
+from lox.stmt import Block, Expression, Function, Print, Var
+
+
+class TestConstantFolder(unittest.TestCase):
+    def setUp(self):
+        self.interpreter = Interpreter()
+        self.folder = ConstantFolder(self.interpreter)
+
+    def parse(self, source):
+        error_handler = ErrorHandler()
+        tokens = Scanner(source, error_handler).scan_tokens()
+        return Parser(tokens, error_handler).parse()
+
+    def folded(self, source):
+        statements = self.parse(source)
+        self.folder.fold(statements)
+        return statements
+
+    def test_fold_arithmetic(self):
+        (stmt,) = self.folded("print (1 + 2) * 3 - -4;")
+        self.assertIsInstance(stmt, Print)
+        self.assertIsInstance(stmt.expression, Literal)
+        self.assertEqual(stmt.expression.value, 13.0)
+
+    def test_fold_strings_and_comparisons(self):
+        concat, compare, negate = self.folded(
+            'print "a" + "b" + 1; print 1 < 2 == true; print !nil;'
+        )
+        self.assertEqual(concat.expression.value, "ab1")
+        self.assertIs(compare.expression.value, True)
+        self.assertIs(negate.expression.value, True)
+
+    def test_runtime_errors_not_folded(self):
+        division, bad_operand = self.folded('print 1 / 0; print -"a";')
+        self.assertIsInstance(division.expression, Binary)
+        self.assertEqual(division.expression.left.value, 1.0)
+        self.assertNotIsInstance(bad_operand.expression, Literal)
+
+    def test_string_repetition_not_folded(self):
+        (stmt,) = self.folded('print "ab" * 3;')
+        self.assertIsInstance(stmt.expression, Binary)
+
+    def test_fold_inside_variables_and_calls(self):
+        var, call = self.folded("var x = y + (2 * 3); f(1 + 1, x);")
+        self.assertIsInstance(var, Var)
+        self.assertIsInstance(var.initializer, Binary)
+        self.assertIsInstance(var.initializer.left, Variable)
+        self.assertEqual(var.initializer.right.value, 6.0)
+
+        self.assertIsInstance(call, Expression)
+        self.assertIsInstance(call.expression, Call)
+        self.assertEqual(call.expression.arguments[0].value, 2.0)
+        self.assertIsInstance(call.expression.arguments[1], Variable)
+
+    def test_grouping_replaced_by_inner_expression(self):
+        (stmt,) = self.folded("print (x);")
+        self.assertNotIsInstance(stmt.expression, Grouping)
+        self.assertIsInstance(stmt.expression, Variable)
+
+    def test_fold_logical_with_literal_left(self):
+        or_true, or_false, and_false, kept = self.folded(
+            "print true or x; print false or x; print nil and x; print x or 1;"
+        )
+        self.assertIs(or_true.expression.value, True)
+        self.assertIsInstance(or_false.expression, Variable)
+        self.assertIsNone(and_false.expression.value)
+        self.assertIsInstance(kept.expression, Logical)
+
+    def test_fold_function_body(self):
+        (function,) = self.folded("fun f() { return 2 * 21; }")
+        self.assertIsInstance(function, Function)
+        self.assertEqual(function.body[0].value.value, 42.0)
+
+    def test_fold_keeps_resolved_locations(self):
+        statements = self.parse("{ var a = 1; print a + (2 * 3); }")
+        error_handler = ErrorHandler()
+        Resolver(self.interpreter, error_handler).resolve(statements)
+        self.assertFalse(error_handler.had_error)
+        self.folder.fold(statements)
+
+        (block,) = statements
+        self.assertIsInstance(block, Block)
+        binary = block.statements[1].expression
+        self.assertIsInstance(binary, Binary)
+        self.assertEqual((binary.left.depth, binary.left.slot), (0, 0))
+        self.assertEqual(binary.right.value, 6.0)
+
+    def test_pruned_branches_are_resolved(self):
+        for source in (
+            "print false and this;",
+            "{ var a = false and a; }",
+            "print true ? 1 : super.x;",
+        ):
+            with self.subTest(source=source):
+                error_handler = ErrorHandler()
+                output = io.StringIO()
+                with redirect_stdout(output):
+                    run(source, error_handler, Interpreter(), False)
+                self.assertTrue(error_handler.had_error)
+                self.assertNotIn("false", output.getvalue().splitlines())
+                self.assertNotIn("1", output.getvalue().splitlines())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import Mock, patch
 
 from lox.environment import Environment
-from lox.error_handler import BreakException, LoxRuntimeError, ReturnException
+from lox.error_handler import LoxRuntimeError
 from lox.expr import (
     Assign,
     Binary,
@@ -18,7 +18,7 @@ from lox.expr import (
     Unary,
     Variable,
 )
-from lox.interpreter import Interpreter
+from lox.interpreter import BREAK, RETURN, Interpreter
 from lox.lox_callable import LoxCallable
 from lox.lox_class import LoxClass
 from lox.lox_instance import LoxInstance
@@ -96,6 +96,25 @@ class TestInterpreter(unittest.TestCase):
         result = self.interpreter.visit_binary_expr(expr)
         self.assertEqual(result, "abcabcabc")
 
+    def test_binary_expr_concatenates_numbers(self):
+        plus = Token(TokenType.PLUS, "+", None, 1)
+        cases = [(3.0, "n=3"), (-2.0, "n=-2"), (2.5, "n=2.5"), (float("inf"), "n=inf")]
+        for value, expected in cases:
+            expr = Binary(Literal("n="), plus, Literal(value))
+            self.assertEqual(self.interpreter.visit_binary_expr(expr), expected)
+
+    def test_binary_expr_caches_operation(self):
+        expr = Binary(Literal(2.0), Token(TokenType.STAR, "*", None, 1), Literal(3.0))
+        self.assertIsNone(expr.operation)
+        self.assertEqual(self.interpreter.visit_binary_expr(expr), 6.0)
+        self.assertIs(expr.operation, Interpreter._multiply)
+        self.assertEqual(self.interpreter.visit_binary_expr(expr), 6.0)
+
+    def test_binary_expr_type_error(self):
+        expr = Binary(Literal("a"), Token(TokenType.LESS, "<", None, 1), Literal(1.0))
+        with self.assertRaises(LoxRuntimeError):
+            self.interpreter.visit_binary_expr(expr)
+
     def test_unary_expr(self):
         expr = Unary(Token(TokenType.MINUS, "-", None, 1), Literal(123.0))
         result = self.interpreter.visit_unary_expr(expr)
@@ -105,6 +124,21 @@ class TestInterpreter(unittest.TestCase):
         result = self.interpreter.visit_unary_expr(expr)
         self.assertEqual(result, False)
 
+    def test_unary_expr_type_error(self):
+        expr = Unary(Token(TokenType.MINUS, "-", None, 1), Literal("a"))
+        with self.assertRaises(LoxRuntimeError):
+            self.interpreter.visit_unary_expr(expr)
+
+    def test_evaluate_dispatches_without_accept(self):
+        expr = Grouping(Literal(1.0))
+        with patch.object(Grouping, "accept", side_effect=AssertionError):
+            self.assertEqual(self.interpreter._evaluate(expr), 1.0)
+
+        other = Mock()
+        other.accept.return_value = 2.0
+        self.assertEqual(self.interpreter._evaluate(other), 2.0)
+        self.assertIsNone(self.interpreter._evaluate(None))
+
     def test_variable_definition_and_access(self):
         # Test variable definition
         var_name = Token(TokenType.IDENTIFIER, "x", None, 1)
@@ -131,6 +165,20 @@ class TestInterpreter(unittest.TestCase):
         result = self.interpreter.visit_variable_expr(var_expr)
         self.assertEqual(result, 100.0)
 
+    def test_resolved_variable_uses_location(self):
+        var_name = Token(TokenType.IDENTIFIER, "x", None, 1)
+        var_expr = Variable(var_name)
+        assign_expr = Assign(var_name, Literal(7.0))
+        self.interpreter.resolve(var_expr, 0, 1)
+        self.interpreter.resolve(assign_expr, 0, 1)
+        self.assertEqual((var_expr.depth, var_expr.slot), (0, 1))
+
+        environment = Environment(self.interpreter.globals, {"y": 0, "x": 1})
+        self.interpreter._environment = environment
+        self.interpreter.visit_assign_expr(assign_expr)
+        self.assertEqual(environment.values, [None, 7.0])
+        self.assertEqual(self.interpreter.visit_variable_expr(var_expr), 7.0)
+
     def test_block_statements(self):
         # Define variable in the global environment
         var_name = Token(TokenType.IDENTIFIER, "x", None, 1)
@@ -140,6 +188,26 @@ class TestInterpreter(unittest.TestCase):
         block = Block(statements)
         self.interpreter.visit_block_stmt(block)
 
+    def test_reusable_block_reuses_environment(self):
+        environments = []
+        recorder = Mock()
+        recorder.accept.side_effect = lambda interpreter: environments.append(
+            interpreter._environment
+        )
+        block = Block([recorder])
+        block.slot_of = {}
+        block.reusable = True
+        condition = Mock()
+        condition.accept.side_effect = [True, True, False]
+
+        self.interpreter.visit_while_stmt(While(condition, block))
+        self.assertEqual(len(environments), 2)
+        self.assertIs(environments[0], environments[1])
+        self.assertIsNone(self.interpreter._block_environments)
+
+        self.interpreter.visit_block_stmt(block)
+        self.assertIsNot(environments[2], environments[0])
+
     def test_if_statement(self):
         then_branch = Mock(spec=Expression)
         else_branch = Mock(spec=Expression)
@@ -178,13 +246,31 @@ class TestInterpreter(unittest.TestCase):
         condition.accept.side_effect = [True, True, False]
         stmt = While(condition, body)
 
-        with patch.object(self.interpreter, "_execute") as mock_execute:
+        with patch.object(
+            self.interpreter, "_execute", return_value=None
+        ) as mock_execute:
             self.interpreter.visit_while_stmt(stmt)
             self.assertEqual(mock_execute.call_count, 2)
 
     def test_break_statement(self):
-        with self.assertRaises(BreakException):
-            self.interpreter.visit_break_stmt(Break())
+        self.assertEqual(self.interpreter.visit_break_stmt(Break()), (BREAK, None))
+
+    def test_while_statement_break(self):
+        condition = Mock()
+        condition.accept.return_value = True
+        stmt = While(condition, Break())
+
+        self.assertIsNone(self.interpreter.visit_while_stmt(stmt))
+        self.assertEqual(condition.accept.call_count, 1)
+
+    def test_return_signal_stops_block(self):
+        value = Literal(1.0)
+        after = Mock()
+        body = [Return(Token(TokenType.RETURN, "return", None, 1), value), after]
+
+        signal = self.interpreter._execute_block(body, Environment())
+        self.assertEqual(signal, (RETURN, 1.0))
+        after.accept.assert_not_called()
 
     def test_function_declaration_and_call(self):
         func_name = Token(TokenType.IDENTIFIER, "test_func", None, 1)
@@ -205,11 +291,72 @@ class TestInterpreter(unittest.TestCase):
         result = self.interpreter.visit_call_expr(call_expr)
         self.assertEqual(result, 42.0)
 
+    def test_call_non_callable(self):
+        call_expr = Call(Literal(1.0), Token(TokenType.RIGHT_PAREN, ")", None, 1), [])
+        with self.assertRaises(LoxRuntimeError):
+            self.interpreter.visit_call_expr(call_expr)
+
+    def test_call_expr_caches_arity(self):
+        callee = Mock()
+        callee.arity.return_value = 0
+        callee.call.return_value = 1.0
+        name = Token(TokenType.IDENTIFIER, "f", None, 1)
+        self.interpreter.globals.define("f", callee)
+        call_expr = Call(Variable(name), Token(TokenType.RIGHT_PAREN, ")", None, 1), [])
+
+        self.assertEqual(self.interpreter.visit_call_expr(call_expr), 1.0)
+        self.assertEqual(self.interpreter.visit_call_expr(call_expr), 1.0)
+        callee.arity.assert_called_once()
+
+        call_expr.arguments = (Literal(1.0),)
+        with self.assertRaises(LoxRuntimeError):
+            self.interpreter.visit_call_expr(call_expr)
+
+    def test_call_expr_does_not_cache_local_callee(self):
+        callee = Mock()
+        callee.arity.return_value = 0
+        name = Token(TokenType.IDENTIFIER, "f", None, 1)
+        environment = Environment(self.interpreter.globals)
+        environment.define("f", callee)
+        self.interpreter._environment = environment
+        variable = Variable(name)
+        variable.depth, variable.slot = 0, 0
+        call_expr = Call(variable, Token(TokenType.RIGHT_PAREN, ")", None, 1), [])
+
+        self.interpreter.visit_call_expr(call_expr)
+        self.assertIsNone(call_expr.last_callee)
+
+    def test_call_nil(self):
+        call_expr = Call(Literal(None), Token(TokenType.RIGHT_PAREN, ")", None, 1), [])
+        with self.assertRaisesRegex(LoxRuntimeError, "Can only call"):
+            self.interpreter.visit_call_expr(call_expr)
+
     def test_division_by_zero(self):
         expr = Binary(Literal(1.0), Token(TokenType.SLASH, "/", None, 1), Literal(0.0))
         with self.assertRaises(LoxRuntimeError):
             self.interpreter.visit_binary_expr(expr)
 
+    def test_class_stmt_reuses_applied_traits(self):
+        trait_name = Token(TokenType.IDENTIFIER, "T", None, 1)
+        method_name = Token(TokenType.IDENTIFIER, "m", None, 1)
+        self.interpreter.visit_trait_stmt(
+            Trait(trait_name, [], [Function(method_name, [], [])])
+        )
+
+        class_name = Token(TokenType.IDENTIFIER, "C", None, 1)
+        class_stmt = Class(class_name, None, [], [], [Variable(trait_name)])
+        self.interpreter.visit_class_stmt(class_stmt)
+        first = self.interpreter.globals.get(class_name)
+        self.interpreter.visit_class_stmt(class_stmt)
+        second = self.interpreter.globals.get(class_name)
+
+        self.assertIsNot(first.methods, second.methods)
+        self.assertIs(first.find_method("m"), second.find_method("m"))
+
+        self.interpreter.globals.assign(trait_name, "not a trait")
+        with self.assertRaises(RuntimeError):
+            self.interpreter.visit_class_stmt(class_stmt)
+
 
 if __name__ == "__main__":
     unittest.main()
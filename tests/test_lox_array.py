@@ -32,6 +32,15 @@ class TestLoxArray(unittest.TestCase):
         self.assertEqual(result, "test")
         self.assertEqual(self.array.elements[1], "test")
 
+    def test_get_reuses_callables(self):
+        get_callable = self.array.get(self.token("get"))
+        set_callable = self.array.get(self.token("set"))
+        self.assertIs(self.array.get(self.token("get")), get_callable)
+        self.assertIs(self.array.get(self.token("set")), set_callable)
+
+        self.array.elements = [1.0]
+        self.assertIs(self.array.get(self.token("get")).elements, self.array.elements)
+
     def test_array_string_representation(self):
         self.array.elements = [1.0, None, "test"]
         self.assertEqual(str(self.array), "[1, nil, test]")
@@ -57,6 +66,16 @@ class TestLoxArray(unittest.TestCase):
         with self.assertRaises(LoxRuntimeError):
             set_callable.call(self.interpreter, [5.0, "test"])
 
+    def test_non_finite_index(self):
+        get_callable = self.array.get(self.token("get"))
+        set_callable = self.array.get(self.token("set"))
+
+        for index in (float("inf"), float("nan")):
+            with self.assertRaises(LoxRuntimeError):
+                get_callable.call(self.interpreter, [index])
+            with self.assertRaises(LoxRuntimeError):
+                set_callable.call(self.interpreter, [index, "test"])
+
     def test_callable_string_representation(self):
         get_callable = ArrayGetCallable([])
         set_callable = ArraySetCallable([])
@@ -59,6 +59,15 @@ class TestLoxClass(unittest.TestCase):
 
         self.assertEqual(child_class.find_method("test"), child_method)
 
+    def test_inherited_method_finding(self):
+        grandparent_method = Mock(spec=LoxFunction)
+        grandparent_class = LoxClass(None, "A", None, {"test": grandparent_method})
+        parent_class = LoxClass(None, "B", grandparent_class, {})
+        child_class = LoxClass(None, "C", parent_class, {})
+
+        self.assertIs(child_class.find_method("test"), grandparent_method)
+        self.assertEqual(child_class.methods, {})
+
     def test_initializer(self):
         init_method = Mock(spec=LoxFunction)
         init_method.arity.return_value = 2
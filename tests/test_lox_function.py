@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import Mock, patch
 
 from lox.environment import Environment
-from lox.error_handler import ReturnException
+from lox.interpreter import RETURN
 from lox.lox_function import LoxFunction
 from lox.stmt import Function
 from lox.tokens import Token, TokenType
@@ -11,6 +11,7 @@ from lox.tokens import Token, TokenType
 class TestLoxFunction(unittest.TestCase):
     def setUp(self):
         self.interpreter = Mock()
+        self.interpreter._execute_block.return_value = None
         self.closure = Environment()
         self.token = lambda lexeme: Token(TokenType.IDENTIFIER, lexeme, None, 1)
 
@@ -54,10 +55,21 @@ class TestLoxFunction(unittest.TestCase):
         self.assertEqual(env.get(self.token("x")), 1)
         self.assertEqual(env.get(self.token("y")), 2)
 
+    def test_function_call_with_resolved_slots(self):
+        self.declaration.slot_of = {"x": 0, "y": 1, "z": 2}
+        function = LoxFunction(self.declaration, self.closure, False)
+
+        function.call(self.interpreter, [1, 2])
+
+        env = self.interpreter._execute_block.call_args[0][1]
+        self.assertEqual(env.values, [1, 2, None])
+        self.assertIs(env.slot_of, self.declaration.slot_of)
+        self.assertIs(env.enclosing, self.closure)
+
     def test_return_handling(self):
         function = LoxFunction(self.declaration, self.closure, False)
 
-        self.interpreter._execute_block.side_effect = ReturnException("result")
+        self.interpreter._execute_block.return_value = (RETURN, "result")
         result = function.call(self.interpreter, [1, 2])
 
         self.assertEqual(result, "result")
@@ -36,6 +36,20 @@ class TestParser(unittest.TestCase):
         self.assertIsInstance(statements[0].expression, Literal)
         self.assertEqual(statements[0].expression.value, 123.0)
 
+    def test_literals_shared_per_parser(self):
+        tokens = self.make_tokens(
+            TokenType.NUMBER,
+            TokenType.SEMICOLON,
+            TokenType.NUMBER,
+            TokenType.SEMICOLON,
+            literals=[1.0, None, 1.0, None],
+        )
+        first, second = Parser(tokens, self.error_handler).parse()
+        self.assertIs(first.expression, second.expression)
+
+        other, _ = Parser(tokens, self.error_handler).parse()
+        self.assertIsNot(other.expression, first.expression)
+
     def test_parse_string_literal(self):
         tokens = self.make_tokens(
             TokenType.STRING, TokenType.SEMICOLON, literals=["test", None]
@@ -67,6 +67,40 @@ class TestResolver(unittest.TestCase):
         scope = self.resolver._scopes.peek()
         self.assertTrue(scope["test"])
 
+    def test_resolve_function_records_slots(self):
+        func = Function(
+            Token(TokenType.IDENTIFIER, "test", None, 1),
+            [Token(TokenType.IDENTIFIER, "param", None, 1)],
+            [Var(Token(TokenType.IDENTIFIER, "local", None, 1), None)],
+        )
+        self.resolver._begin_scope()
+        self.resolver.visit_function_stmt(func)
+
+        self.assertEqual(func.slot_of, {"param": 0, "local": 1})
+
+    def test_resolve_block_records_slots(self):
+        first = Var(Token(TokenType.IDENTIFIER, "a", None, 1), None)
+        second = Var(Token(TokenType.IDENTIFIER, "b", None, 1), None)
+        block = Block([first, second])
+        self.resolver.visit_block_stmt(block)
+
+        self.assertEqual(block.slot_of, {"a": 0, "b": 1})
+        self.assertEqual((first.slot, second.slot), (0, 1))
+        self.assertTrue(block.reusable)
+
+    def test_resolve_block_with_function_is_not_reusable(self):
+        func = Function(Token(TokenType.IDENTIFIER, "f", None, 1), [], [])
+        block = Block([Block([func])])
+        self.resolver.visit_block_stmt(block)
+
+        self.assertFalse(block.reusable)
+        self.assertFalse(block.statements[0].reusable)
+
+    def test_resolve_global_var_has_no_slot(self):
+        stmt = Var(Token(TokenType.IDENTIFIER, "g", None, 1), None)
+        self.resolver.visit_var_stmt(stmt)
+        self.assertEqual(stmt.slot, -1)
+
     def test_resolve_class_declaration(self):
         class_stmt = Class(
             Token(TokenType.IDENTIFIER, "TestClass", None, 1), None, [], [], []
@@ -98,6 +132,39 @@ class TestResolver(unittest.TestCase):
         self.resolver.visit_class_stmt(class_stmt)
         self.assertEqual(self.resolver.current_class, ClassType.NONE)
 
+    def test_resolve_local_records_slot(self):
+        expr = Variable(Token(TokenType.IDENTIFIER, "y", None, 1))
+        self.resolver._begin_scope()
+        self.resolver._declare(Token(TokenType.IDENTIFIER, "x", None, 1))
+        self.resolver._declare(Token(TokenType.IDENTIFIER, "y", None, 1))
+        self.resolver._begin_scope()
+
+        self.resolver.visit_variable_expr(expr)
+        self.assertEqual((expr.depth, expr.slot), (1, 1))
+
+    def test_resolve_class_method_scopes(self):
+        outer = Variable(Token(TokenType.IDENTIFIER, "outer", None, 1))
+        this_expr = This(Token(TokenType.THIS, "this", None, 1))
+        class_method = Function(
+            Token(TokenType.IDENTIFIER, "create", None, 1),
+            [],
+            [Print(outer), Print(this_expr)],
+        )
+        class_stmt = Class(
+            Token(TokenType.IDENTIFIER, "TestClass", None, 1),
+            None,
+            [],
+            [class_method],
+            [],
+        )
+        self.resolver._begin_scope()
+        self.resolver._declare(Token(TokenType.IDENTIFIER, "outer", None, 1))
+        self.resolver.visit_class_stmt(class_stmt)
+
+        # Function scope, then the class method's 'this' scope, then the block.
+        self.assertEqual((outer.depth, outer.slot), (2, 0))
+        self.assertEqual((this_expr.depth, this_expr.slot), (1, 0))
+
     def test_resolve_this_in_class(self):
         this_expr = This(Token(TokenType.THIS, "this", None, 1))
         self.resolver.current_class = ClassType.CLASS
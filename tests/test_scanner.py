@@ -82,6 +82,13 @@ class TestScanner(unittest.TestCase):
         self.assertEqual(tokens[0].lexeme, "varName")
         self.assertEqual(tokens[1].type, TokenType.EOF)
 
+    def test_identifier_lexemes_interned(self):
+        source = "count = count + 1;"
+        scanner = Scanner(source, self.error_handler)
+        tokens = scanner.scan_tokens()
+
+        self.assertIs(tokens[0].lexeme, tokens[2].lexeme)
+
     def test_keyword_token(self):
         source = "if else while for"
         scanner = Scanner(source, self.error_handler)
@@ -110,6 +110,16 @@ class TestStmt(unittest.TestCase):
         stmt.accept(self.visitor)
         self.visitor.visit_return_stmt.assert_called_once_with(stmt)
 
+    def test_stmts_have_no_dict(self):
+        stmt = Break()
+        self.assertFalse(hasattr(stmt, "__dict__"))
+        with self.assertRaises(AttributeError):
+            stmt.extra = True
+
+    def test_unimplemented_visit_raises(self):
+        with self.assertRaises(NotImplementedError):
+            Break().accept(StmtVisitor())
+
 
 if __name__ == "__main__":
     unittest.main()
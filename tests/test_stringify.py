@@ -0,0 +1,22 @@
+import unittest
+
+from lox.stringify import format_number
+
+
+class TestFormatNumber(unittest.TestCase):
+    def test_integral_numbers_drop_fraction(self):
+        self.assertEqual(format_number(3.0), "3")
+        self.assertEqual(format_number(-2.0), "-2")
+        self.assertEqual(format_number(0.0), "0")
+
+    def test_fractional_numbers(self):
+        self.assertEqual(format_number(2.5), "2.5")
+        self.assertEqual(format_number(-0.25), "-0.25")
+
+    def test_special_values(self):
+        self.assertEqual(format_number(float("inf")), "inf")
+        self.assertEqual(format_number(float("nan")), "nan")
+
+
+if __name__ == "__main__":
+    unittest.main()